@@ -1,13 +1,94 @@
 """Clean command."""
 
+from functools import partial
 from pathlib import Path
 
 import typer
 from loguru import logger
 
 from vid_cleaner.config import VidCleanerConfig
+from vid_cleaner.constants import SYMBOL_CHECK
 from vid_cleaner.models.video_file import VideoFile
-from vid_cleaner.utils import tmp_to_output
+from vid_cleaner.utils import process_files, tmp_to_output
+
+
+def _clean_file(
+    video: VideoFile,
+    out: Path,
+    replace: bool,
+    downmix_stereo: bool,
+    drop_original_audio: bool,
+    keep_all_subtitles: bool,
+    keep_commentary: bool,
+    keep_local_subtitles: bool,
+    subs_drop_local: bool,
+    langs_to_keep: list[str],
+    h265: bool,
+    vp9: bool,
+    video_1080: bool,
+    force: bool,
+    dry_run: bool,
+    verbosity: int,
+) -> Path | None:
+    """Clean a single video file and copy the result to its output location.
+
+    See `clean` for a description of the options.
+
+    Returns:
+        Path | None: The path to the cleaned file, or None on a dry run.
+    """
+    logger.info("⇨ {}", video.path.name)
+
+    # Remove the temporary files as soon as this file is done, in whichever process runs it
+    try:
+        video.reorder_streams(dry_run=dry_run)
+
+        video.process_streams(
+            langs_to_keep=langs_to_keep,
+            drop_original_audio=drop_original_audio,
+            keep_commentary=keep_commentary,
+            downmix_stereo=downmix_stereo,
+            keep_all_subtitles=keep_all_subtitles,
+            keep_local_subtitles=keep_local_subtitles,
+            subs_drop_local=subs_drop_local,
+            dry_run=dry_run,
+            verbosity=verbosity,
+        )
+
+        if video_1080:
+            video.video_to_1080p(force=force, dry_run=dry_run)
+
+        if h265:
+            video.convert_to_h265(force=force, dry_run=dry_run)
+
+        if vp9:
+            video.convert_to_vp9(force=force, dry_run=dry_run)
+
+        if dry_run:
+            return None
+
+        if video.current_tmp_file is not None:
+            out_file = tmp_to_output(
+                video.current_tmp_file, stem=video.stem, new_file=out, overwrite=replace
+            )
+        elif out is None or out.expanduser().resolve() == video.path:
+            # Nothing changed and no other output was requested, so there is nothing to write
+            logger.info("{} No changes needed", SYMBOL_CHECK)
+            return None
+        else:
+            # The requested output file is still written, as an unchanged copy of the input
+            logger.info("{} No changes needed, copy to {}", SYMBOL_CHECK, out)
+            out_file = tmp_to_output(
+                video.path, stem=video.stem, new_file=out, overwrite=replace, copy=True
+            )
+
+        if replace and out_file != video.path:
+            logger.debug("Delete: {}", video.path)
+            video.path.unlink()
+
+        return out_file
+    finally:
+        video.cleanup()
 
 
 def clean(
@@ -27,6 +108,7 @@ def clean(
     force: bool,
     dry_run: bool,
     verbosity: int,
+    jobs: int | None = None,
 ) -> None:
     """Processes a list of video files with various cleaning and conversion options.
 
@@ -49,53 +131,38 @@ def clean(
         force: If True, force conversion even if it might result in loss of quality.
         dry_run: If True, perform a trial run without making any changes.
         verbosity: An integer that sets the verbosity level of the operation's output.
+        jobs: Number of files to process in parallel. None uses a default based on the CPU count.
 
     Raises:
-        typer.BadParameter: If both h265 and vp9 flags are set to True.
         typer.Exit: If the operation completes successfully.
     """
-    if h265 and vp9:
-        msg = "Cannot convert to both H265 and VP9"
-        raise typer.BadParameter(msg)
-
     languages = langs or ",".join(VidCleanerConfig().keep_languages)
 
-    for video in files:
-        logger.info(f"⇨ {video.path.name}")
-
-        video.reorder_streams(dry_run=dry_run)
-
-        video.process_streams(
-            langs_to_keep=languages.split(","),
-            drop_original_audio=drop_original_audio,
-            keep_commentary=keep_commentary,
-            downmix_stereo=downmix_stereo,
-            keep_all_subtitles=keep_all_subtitles,
-            keep_local_subtitles=keep_local_subtitles,
-            subs_drop_local=subs_drop_local,
-            dry_run=dry_run,
-            verbosity=verbosity,
-        )
-
-        if video_1080:
-            video.video_to_1080p(force=force, dry_run=dry_run)
-
-        if h265:
-            video.convert_to_h265(force=force, dry_run=dry_run)
-
-        if vp9:
-            video.convert_to_vp9(force=force, dry_run=dry_run)
-
-        if not dry_run:
-            out_file = tmp_to_output(
-                video.current_tmp_file, stem=video.stem, new_file=out, overwrite=replace
-            )
+    clean_file = partial(
+        _clean_file,
+        out=out,
+        replace=replace,
+        downmix_stereo=downmix_stereo,
+        drop_original_audio=drop_original_audio,
+        keep_all_subtitles=keep_all_subtitles,
+        keep_commentary=keep_commentary,
+        keep_local_subtitles=keep_local_subtitles,
+        subs_drop_local=subs_drop_local,
+        langs_to_keep=languages.split(","),
+        h265=h265,
+        vp9=vp9,
+        video_1080=video_1080,
+        force=force,
+        dry_run=dry_run,
+        verbosity=verbosity,
+    )
+    # The parent also cleans up every file, which covers workers that die or are interrupted
+    try:
+        for out_file in process_files(clean_file, files, jobs=jobs):
+            if out_file:
+                logger.success("{}", out_file)
+    finally:
+        for video in files:
             video.cleanup()
 
-            if replace and out_file != video.path:
-                logger.debug(f"Delete: {video.path}")
-                video.path.unlink()
-
-            logger.success(f"{out_file}")
-
     raise typer.Exit()
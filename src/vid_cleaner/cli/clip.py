@@ -1,17 +1,74 @@
 """Clip command for vid_cleaner."""
 
 import re
+from functools import partial
 from pathlib import Path
 
 import typer
 from loguru import logger
 
 from vid_cleaner.models.video_file import VideoFile
-from vid_cleaner.utils import tmp_to_output
+from vid_cleaner.utils import process_files, tmp_to_output
+
+# HH:MM:SS with minutes and seconds limited to 00-59
+TIME_PATTERN = re.compile(r"\d{2}:[0-5]\d:[0-5]\d")
+
+
+def _validate_timestamp(value: str, name: str) -> None:
+    """Check that a clip timestamp is in HH:MM:SS format.
+
+    Args:
+        value: The timestamp to check.
+        name: The option name used in the error message, e.g. "Start".
+
+    Raises:
+        typer.BadParameter: If the timestamp does not match HH:MM:SS.
+    """
+    if not TIME_PATTERN.fullmatch(value):
+        msg = f"{name} must be in format HH:MM:SS"  # type: ignore [unreachable]
+        raise typer.BadParameter(msg)
+
+
+def _clip_file(
+    video: VideoFile, start: str, duration: str, out: Path, overwrite: bool, dry_run: bool
+) -> Path | None:
+    """Clip a single video file and copy the clip to its output location.
+
+    Args:
+        video: The VideoFile to clip.
+        start: The start time for the clip in HH:MM:SS format.
+        duration: The duration of the clip in HH:MM:SS format.
+        out: The output directory Path where the clipped file will be saved.
+        overwrite: A boolean indicating if existing files should be overwritten.
+        dry_run: A boolean indicating if the clip operation should be simulated (no actual clipping).
+
+    Returns:
+        Path | None: The path to the clipped file, or None on a dry run.
+    """
+    logger.info("⇨ {}", video.path.name)
+
+    # Remove the temporary files as soon as this file is done, in whichever process runs it
+    try:
+        video.clip(start, duration, dry_run=dry_run)
+
+        if dry_run:
+            return None
+
+        return tmp_to_output(
+            video.current_tmp_file, stem=video.stem, new_file=out, overwrite=overwrite
+        )
+    finally:
+        video.cleanup()
 
 
 def clip(
-    files: list[VideoFile], start: str, duration: str, out: Path, overwrite: bool, dry_run: bool
+    files: list[VideoFile],
+    start: str,
+    duration: str,
+    out: Path,
+    overwrite: bool,
+    dry_run: bool,
+    jobs: int | None = None,
 ) -> None:
     """Clips video files based on the specified start time and duration, saving the output in a given directory.
 
@@ -24,31 +81,24 @@ def clip(
         out: The output directory Path where the clipped files will be saved.
         overwrite: A boolean indicating if existing files should be overwritten.
         dry_run: A boolean indicating if the clip operation should be simulated (no actual clipping).
+        jobs: Number of files to clip in parallel. None uses a default based on the CPU count.
 
     Raises:
-        typer.BadParameter: If either 'start' or 'duration' does not match the expected HH:MM:SS time format.
         typer.Exit: If the operation completes successfully.
     """
-    time_pattern = re.compile(r"^\d{2}:\d{2}:\d{2}$")
-
-    if not time_pattern.match(start):
-        msg = "Start must be in format HH:MM:SS"  # type: ignore [unreachable]
-        raise typer.BadParameter(msg)
-
-    if not time_pattern.match(duration):
-        msg = "Duration must be in format HH:MM:SS"  # type: ignore [unreachable]
-        raise typer.BadParameter(msg)
-
-    for video in files:
-        logger.info(f"⇨ {video.path.name}")
-
-        video.clip(start, duration, dry_run=dry_run)
+    _validate_timestamp(start, "Start")
+    _validate_timestamp(duration, "Duration")
 
-        if not dry_run:
-            out_file = tmp_to_output(
-                video.current_tmp_file, stem=video.stem, new_file=out, overwrite=overwrite
-            )
+    clip_file = partial(
+        _clip_file, start=start, duration=duration, out=out, overwrite=overwrite, dry_run=dry_run
+    )
+    # The parent also cleans up every file, which covers workers that die or are interrupted
+    try:
+        for out_file in process_files(clip_file, files, jobs=jobs):
+            if out_file:
+                logger.success("{}", out_file)
+    finally:
+        for video in files:
             video.cleanup()
-            logger.success(f"{out_file}")
 
     raise typer.Exit()
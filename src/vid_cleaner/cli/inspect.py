@@ -1,12 +1,31 @@
 """Inspect command."""  # noqa: A005
 
+from functools import partial
+
 import typer
+from rich.table import Table
 
 from vid_cleaner.models.video_file import VideoFile
-from vid_cleaner.utils import console
+from vid_cleaner.utils import console, process_files
+
 
+def _inspect_file(video: VideoFile, json_output: bool = False) -> dict | Table:
+    """Probe a single video file and build its printable details.
 
-def inspect(files: list[VideoFile], json_output: bool = False) -> None:
+    Args:
+        video: The `VideoFile` to inspect.
+        json_output: A boolean flag. If True, return the ffprobe JSON response instead of a table.
+
+    Returns:
+        dict | Table: The ffprobe JSON response or a table of the video streams.
+    """
+    if json_output:
+        return video.probe.json_data
+
+    return video.as_stream_table()
+
+
+def inspect(files: list[VideoFile], json_output: bool = False, jobs: int | None = None) -> None:
     """Inspect a list of video files and output their metadata details.
 
     Iterates over a list of video files, using `ffprobe` to inspect each file. Depending on the `json_output` flag, the function either prints a JSON representation of the video file details or a formatted table of the video streams. The function exits the program after printing the details of all video files.
@@ -14,15 +33,12 @@ def inspect(files: list[VideoFile], json_output: bool = False) -> None:
     Args:
         files: A list of `VideoFile` objects to inspect.
         json_output: A boolean flag. If True, output the details in JSON format. Defaults to False.
+        jobs: Number of files to probe in parallel. None uses a default based on the CPU count.
 
     Raises:
         typer.Exit: Exits the program after printing the details of all video files.
     """
-    for video in files:
-        if json_output:
-            console.print(video.ffprobe_json())
-            continue
-
-        console.print(video.as_stream_table())
+    for details in process_files(partial(_inspect_file, json_output=json_output), files, jobs=jobs):
+        console.print(details)
 
     raise typer.Exit()
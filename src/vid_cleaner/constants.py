@@ -46,9 +46,19 @@ class AudioLayout(Enum):
     SURROUND7 = 8
 
 
+# Frozen once at import so membership checks don't iterate the enums on every call
+VIDEO_SUFFIXES: frozenset[str] = frozenset(container.value for container in VideoContainerTypes)
+AUDIO_LAYOUT_VALUES: frozenset[int] = frozenset(layout.value for layout in AudioLayout)
+
 SYMBOL_CHECK = "✔"
 
 EXCLUDED_VIDEO_CODECS = {"mjpeg", "mjpg", "png"}
+# ffprobe -show_entries needed to build the inspect stream table
+FFPROBE_TABLE_ENTRIES = (
+    "format=filename:format_tags=title"
+    ":stream=index,codec_name,codec_type,channels,channel_layout,width,height"
+    ":stream_tags=language,title"
+)
 FFMPEG_APPEND: list[str] = ["-max_muxing_queue_size", "9999"]
 FFMPEG_PREPEND: list[str] = ["-y", "-hide_banner"]
 H265_CODECS = {"hevc", "vp9"}
@@ -58,3 +68,6 @@ VERSION = "0.3.6"
 # shutil.copy uses 1024 * 1024 if _WINDOWS else 64 * 1024
 # however, in my testing on MacOS with SSD, I've found a much larger buffer is faster
 BUFFER_SIZE = 4096 * 1024
+
+# Minimum seconds between progress bar redraws while copying files
+PROGRESS_UPDATE_INTERVAL = 0.1
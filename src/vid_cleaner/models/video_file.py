@@ -1,8 +1,10 @@
 """VideoFile model."""
 
-import atexit
+import os
 import re
 import uuid
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
 from typing import Optional, assert_never
 
@@ -19,30 +21,27 @@ from vid_cleaner.constants import (
     EXCLUDED_VIDEO_CODECS,
     FFMPEG_APPEND,
     FFMPEG_PREPEND,
+    FFPROBE_TABLE_ENTRIES,
     H265_CODECS,
     SYMBOL_CHECK,
     AudioLayout,
     CodecTypes,
 )
-from vid_cleaner.utils import (
-    channels_to_layout,
-    console,
-    ffprobe,
-    query_radarr,
-    query_sonarr,
-    query_tmdb,
+from vid_cleaner.utils import channels_to_layout, console, ffprobe
+
+_INSPECT_COLS = (
+    "#",
+    "Type",
+    "Codec Name",
+    "Language",
+    "Channels",
+    "Channel Layout",
+    "Width",
+    "Height",
+    "Title",
 )
 
 
-def cleanup_on_exit(video_file: "VideoFile") -> None:  # pragma: no cover
-    """Cleanup temporary files on exit.
-
-    Args:
-        video_file (VideoFile): The VideoFile object to perform cleanup on.
-    """
-    video_file.cleanup()
-
-
 class VideoStream(BaseModel):
     """VideoStream model."""
 
@@ -90,7 +89,7 @@ class VideoProbe(BaseModel):
             VideoProbe: A VideoProbe object containing parsed information about the video file.
         """
         # Find name
-        if "title" in json_obj["format"]["tags"]:
+        if "title" in json_obj["format"].get("tags", {}):
             name = json_obj["format"]["tags"]["title"]
         elif "filename" in json_obj["format"]:
             name = json_obj["format"]["filename"]
@@ -140,18 +139,12 @@ class VideoProbe(BaseModel):
                 language, channels, channel layout, width, height, and title.
         """
         table = Table(title=self.name)
-        table.add_column("#")
-        table.add_column("Type")
-        table.add_column("Codec Name")
-        table.add_column("Language")
-        table.add_column("Channels")
-        table.add_column("Channel Layout")
-        table.add_column("Width")
-        table.add_column("Height")
-        table.add_column("Title")
+        for column in _INSPECT_COLS:
+            table.add_column(column)
 
+        add_row = table.add_row
         for stream in self.streams:
-            table.add_row(
+            add_row(
                 str(stream.index),
                 stream.codec_type.value,
                 stream.codec_name,
@@ -185,9 +178,8 @@ class VideoFile:
         self.current_tmp_file: Path | None = None  # Current temporary file
         self.tmp_files: list[Path] = []  # All temporary files created by this VideoFile
         self.tmp_file_number = 1
-
-        # Register cleanup on exit
-        atexit.register(cleanup_on_exit, self)
+        # Stream-copy steps (title, step, command) waiting to be fused into the next ffmpeg pass
+        self._pending_steps: list[tuple[str, str, list[str]]] = []
 
     @staticmethod
     def _downmix_to_stereo(streams: list[VideoStream]) -> list[str]:
@@ -267,7 +259,7 @@ class VideoFile:
                 )
                 new_index += 1
 
-        logger.trace(f"PROCESS AUDIO: Downmix command: {downmix_command}")
+        logger.trace("PROCESS AUDIO: Downmix command: {}", downmix_command)
         return downmix_command
 
     def _find_original_language(self, verbosity: int) -> Lang:  # pragma: no cover
@@ -294,14 +286,16 @@ class VideoFile:
         imdb_id = match.group(0) if match else self._query_arr_apps_for_imdb_id()
 
         # Query TMDB for the original language
+        from vid_cleaner.utils import query_tmdb  # noqa: PLC0415
+
         response = query_tmdb(imdb_id, verbosity=verbosity) if imdb_id else None
 
         if response and (tmdb_response := response.get("movie_results", [{}])[0]):
             original_language = tmdb_response.get("original_language")
-            logger.trace(f"TMDB: Original language: {original_language}")
+            logger.trace("TMDB: Original language: {}", original_language)
 
         if not original_language:
-            logger.debug(f"Could not find original language for: {self.name}")
+            logger.debug("Could not find original language for: {}", self.name)
             return None
 
         # If the original language is pulled as Chinese (cn). iso639 expects 'zh' for Chinese.
@@ -311,7 +305,7 @@ class VideoFile:
         try:
             language = Lang(original_language)
         except Exception:  # noqa: BLE001
-            logger.debug(f"iso639: Could not find language for: {self.name}")
+            logger.debug("iso639: Could not find language for: {}", self.name)
             return None
 
         # Set language attribute
@@ -322,12 +316,14 @@ class VideoFile:
     def _get_probe(self) -> VideoProbe:  # pragma: no cover
         """Retrieve the ffprobe probe information for the video.
 
-        Fetch detailed information about the video file using ffprobe. Optionally filter
-        the information by a specific key.
+        Fetch detailed information about the current input file using ffprobe. Until a temporary file has been created, the memoized probe of the source file is returned.
 
         Returns:
             VideoProbe: The ffprobe probe information.
         """
+        if not self.tmp_files:
+            return self.probe
+
         input_path, _ = self._get_input_and_output()
 
         return VideoProbe.parse_probe_response(ffprobe(input_path), self.stem)
@@ -354,18 +350,22 @@ class VideoFile:
         suffix = suffix or self.suffix
         self.tmp_dir.mkdir(parents=True, exist_ok=True)
 
+        # Read the tmp directory once and reuse the entries for naming and pruning
+        with os.scandir(self.tmp_dir) as it:
+            entries = list(it)
+
         # Create a new tmp file name
-        for file in self.tmp_dir.iterdir():
-            if file.stem.startswith(f"{self.tmp_file_number}_"):
+        for entry in entries:
+            if entry.name.startswith(f"{self.tmp_file_number}_"):
                 self.tmp_file_number += 1
 
         output_file = self.tmp_dir / f"{self.tmp_file_number}_{step}{suffix}"
 
         # Remove all but the most recent tmp file to reduce the size of tmp files on disk
-        for file in self.tmp_dir.iterdir():
-            if file != input_file:
-                logger.trace(f"Remove: {file}")
-                file.unlink()
+        for entry in entries:
+            if Path(entry.path) != input_file:
+                logger.trace("Remove: {}", entry.path)
+                Path(entry.path).unlink()
 
         return input_file, output_file
 
@@ -389,7 +389,7 @@ class VideoFile:
 
             command.extend(["-map", f"0:{stream.index}"])
 
-        logger.trace(f"PROCESS VIDEO: {command}")
+        logger.trace("PROCESS VIDEO: {}", command)
         return command
 
     def _process_subtitles(
@@ -437,7 +437,7 @@ class VideoFile:
                 and stream.title is not None
                 and re.search(r"commentary|sdh|description", stream.title, re.IGNORECASE)
             ):
-                logger.trace(rf"PROCESS SUBTITLES: Remove stream #{stream.index} \[commentary]")
+                logger.trace(r"PROCESS SUBTITLES: Remove stream #{} \[commentary]", stream.index)
                 continue
 
             if keep_all_subtitles:
@@ -448,7 +448,9 @@ class VideoFile:
                 if keep_local_subtitles and (
                     stream.language.lower() == "und" or Lang(stream.language) in langs
                 ):
-                    logger.trace(f"PROCESS SUBTITLES: Keep stream #{stream.index} (local language)")
+                    logger.trace(
+                        "PROCESS SUBTITLES: Keep stream #{} (local language)", stream.index
+                    )
                     command.extend(["-map", f"0:{stream.index}"])
                     continue
 
@@ -459,14 +461,14 @@ class VideoFile:
                     and (stream.language.lower == "und" or Lang(stream.language) in langs)
                 ):
                     logger.trace(
-                        f"PROCESS SUBTITLES: Keep stream #{stream.index} (original language)"
+                        "PROCESS SUBTITLES: Keep stream #{} (original language)", stream.index
                     )
                     command.extend(["-map", f"0:{stream.index}"])
                     continue
 
-            logger.trace(f"PROCESS SUBTITLES: Remove stream #{stream.index}")
+            logger.trace("PROCESS SUBTITLES: Remove stream #{}", stream.index)
 
-        logger.trace(f"PROCESS SUBTITLES: {command}")
+        logger.trace("PROCESS SUBTITLES: {}", command)
         return command
 
     def _process_audio(
@@ -519,7 +521,7 @@ class VideoFile:
                 and stream.title
                 and re.search(r"commentary|sdh|description", stream.title, re.IGNORECASE)
             ):
-                logger.trace(rf"PROCESS AUDIO: Remove stream #{stream.index} \[commentary]")
+                logger.trace(r"PROCESS AUDIO: Remove stream #{} \[commentary]", stream.index)
                 continue
 
             # Keep streams with specified languages
@@ -528,7 +530,7 @@ class VideoFile:
                 streams_to_keep.append(stream)
                 continue
 
-            logger.trace(f"PROCESS AUDIO: Remove stream #{stream.index}")
+            logger.trace("PROCESS AUDIO: Remove stream #{}", stream.index)
 
         # Failsafe to cancel processing if all streams would be removed following this plugin. We don't want no audio.
         if not command:
@@ -539,28 +541,36 @@ class VideoFile:
         # Downmix to stereo if needed
         downmix_command = self._downmix_to_stereo(streams_to_keep) if downmix_stereo else []
 
-        logger.trace(f"PROCESS AUDIO: {command}")
+        logger.trace("PROCESS AUDIO: {}", command)
         return command, downmix_command
 
     def _query_arr_apps_for_imdb_id(self) -> str | None:
         """Query Radarr and Sonarr APIs to find the IMDb ID of the video.
 
-        This method attempts to retrieve the IMDb ID based on the video file's name by utilizing external APIs for Radarr and Sonarr as sources. It first queries Radarr API and checks if the response contains the movie information with the IMDb ID. If found, it returns the IMDb ID.
+        This method attempts to retrieve the IMDb ID based on the video file's name by utilizing external APIs for Radarr and Sonarr as sources. Radarr is checked first for movie information with the IMDb ID. If found, it returns the IMDb ID.
 
-        If not found, it then queries Sonarr API and checks if the response contains the series information with the IMDb ID. If found, it returns the IMDb ID. If no IMDb ID is found from either API, it returns None.
+        If not found, Sonarr is checked for series information with the IMDb ID. If found, it returns the IMDb ID. If no IMDb ID is found from either API, it returns None.
 
         Returns:
             str | None: The IMDb ID if found, otherwise None.
         """
-        response = query_radarr(self.name)
-        if response and "movie" in response and "imdbId" in response["parsedMovieInfo"]:
-            return response["movie"]["imdbId"]
+        from vid_cleaner.utils import query_arr_apps  # noqa: PLC0415
 
-        response = query_sonarr(self.name)
-        if response and "series" in response and "imdbId" in response["series"]:
-            return response["series"]["imdbId"]
+        return query_arr_apps(self.name)
 
-        return None
+    def _flush_pending_steps(self, dry_run: bool = False) -> None:
+        """Run any queued stream-copy steps as a single ffmpeg pass.
+
+        Every queued step maps streams from a probe of the same source file, so the most recent step fully describes the output and earlier steps are folded into it.
+
+        Args:
+            dry_run (bool, optional): Run in dry run mode. Defaults to False.
+        """
+        if not self._pending_steps:
+            return
+
+        title, step, command = self._pending_steps.pop()
+        self._run_ffmpeg(command, title=title, step=step, dry_run=dry_run, fold_pending=True)
 
     def _run_ffmpeg(
         self,
@@ -569,6 +579,7 @@ class VideoFile:
         suffix: str | None = None,
         step: str | None = None,
         dry_run: bool = False,
+        fold_pending: bool = False,
     ) -> Path:
         """Execute an ffmpeg command.
 
@@ -581,32 +592,43 @@ class VideoFile:
             title (str): Title for logging the process.
             suffix (str | None, optional): Suffix for the output file. Defaults to None.
             step (str | None, optional): Step name for file naming. Defaults to None.
+            fold_pending (bool, optional): The command already produces the output of any queued stream-copy steps, so fold them into this pass instead of running them first. Defaults to False.
 
         Returns:
             Path: Path to the output file generated by the ffmpeg command.
         """
+        if not fold_pending:
+            self._flush_pending_steps(dry_run=dry_run)
+
+        titles = [pending_title for pending_title, _, _ in self._pending_steps] + [title]
+        self._pending_steps.clear()
+
         input_path, output_path = self._get_input_and_output(suffix=suffix, step=step)
 
         cmd: list[str] = ["ffmpeg", *FFMPEG_PREPEND, "-i", str(input_path)]
         cmd.extend(command)
         cmd.extend([*FFMPEG_APPEND, str(output_path)])
 
-        logger.trace(f"RUN FFMPEG:\n{' '.join(cmd)}")
+        logger.opt(lazy=True).trace("RUN FFMPEG:\n{}", lambda: " ".join(cmd))
 
         if dry_run:
-            console.rule(f"{title} (dry run)")
+            console.rule(f"{', '.join(titles)} (dry run)")
             console.print(f"[code]{' '.join(cmd)}[/code]")
             return output_path
 
         # Run ffmpeg
         ff = FfmpegProgress(cmd)
 
-        with Progress(transient=True) as progress:
-            task = progress.add_task(f"{title}…", total=100)
+        # Pool workers disable interactive output, so the bar does not interleave with other files
+        with Progress(
+            console=console, transient=True, disable=not console.is_interactive
+        ) as progress:
+            task = progress.add_task(f"{', '.join(titles)}…", total=100)
             for complete in ff.run_command_with_progress():
                 progress.update(task, completed=complete)
 
-        logger.info(f"{SYMBOL_CHECK} {title}")
+        for completed_title in titles:
+            logger.info("{} {}", SYMBOL_CHECK, completed_title)
 
         # Set current temporary file and return path
         self.current_tmp_file = output_path
@@ -623,14 +645,28 @@ class VideoFile:
             logger.debug("Clean up temporary files")
 
             # Clean up temporary files
-            for file in self.tmp_dir.iterdir():
-                logger.trace(f"Remove: {file}")
-                file.unlink()
+            with os.scandir(self.tmp_dir) as it:
+                for entry in it:
+                    logger.trace("Remove: {}", entry.path)
+                    Path(entry.path).unlink()
 
             # Clean up temporary directory
-            logger.trace(f"Remove: {self.tmp_dir}")
+            logger.trace("Remove: {}", self.tmp_dir)
             self.tmp_dir.rmdir()
 
+    @staticmethod
+    def _clip_command(start: str, duration: str) -> list[str]:
+        """Build the ffmpeg arguments that copy a segment of every stream.
+
+        Args:
+            start (str): Start time of the clip.
+            duration (str): Duration of the clip.
+
+        Returns:
+            list[str]: The ffmpeg command arguments for the clip.
+        """
+        return ["-ss", start, "-t", duration, "-map", "0", "-c", "copy"]
+
     def clip(
         self,
         start: str,
@@ -650,11 +686,10 @@ class VideoFile:
         Returns:
             Path: Path to the clipped video file.
         """
-        # Build ffmpeg command
-        ffmpeg_command: list[str] = ["-ss", start, "-t", duration, "-map", "0", "-c", "copy"]
-
         # Run ffmpeg
-        return self._run_ffmpeg(ffmpeg_command, title="Clip video", step="clip", dry_run=dry_run)
+        return self._run_ffmpeg(
+            self._clip_command(start, duration), title="Clip video", step="clip", dry_run=dry_run
+        )
 
     def convert_to_h265(
         self,
@@ -674,6 +709,7 @@ class VideoFile:
         Returns:
             Path: Path to the converted or original video file.
         """
+        self._flush_pending_steps(dry_run=dry_run)
         input_path, _ = self._get_input_and_output()
 
         # Get ffprobe probe
@@ -712,7 +748,7 @@ class VideoFile:
         # Used from here https://blog.frame.io/2017/03/06/calculate-video-bitrates/
 
         stat = input_path.stat()
-        logger.trace(f"File size: {stat}")
+        logger.trace("File size: {}", stat)
         file_size_megabytes = stat.st_size / 1000000
 
         current_bitrate = int(file_size_megabytes / (duration * 0.0075))
@@ -759,6 +795,7 @@ class VideoFile:
         Returns:
             Path: Path to the converted or original video file.
         """
+        self._flush_pending_steps(dry_run=dry_run)
         input_path, _ = self._get_input_and_output()
 
         # Get ffprobe probe
@@ -821,7 +858,7 @@ class VideoFile:
     ) -> Path:
         """Process the video file according to specified audio and subtitle preferences.
 
-        Execute the necessary steps to process the video file, including managing audio and subtitle streams.  Keep or discard audio streams based on specified languages, commentary preferences, and downmix settings. Similarly, filter subtitle streams based on language preferences and criteria such as keeping commentary or local subtitles. Perform the processing using ffmpeg and return the path to the processed video file.
+        Execute the necessary steps to process the video file, including managing audio and subtitle streams.  Keep or discard audio streams based on specified languages, commentary preferences, and downmix settings. Similarly, filter subtitle streams based on language preferences and criteria such as keeping commentary or local subtitles. Perform the processing using ffmpeg and return the path to the processed video file. When every stream would be kept in its current order and nothing is downmixed, ffmpeg is not run and the current input file is returned.
 
         Args:
             dry_run (bool, optional): Run in dry run mode. Defaults to False.
@@ -862,6 +899,18 @@ class VideoFile:
             subs_drop_local=subs_drop_local,
         )
 
+        map_command = video_map_command + audio_map_command + subtitle_map_command
+
+        # With nothing queued, dropped or downmixed the pass would only copy the file unchanged
+        if (
+            not self._pending_steps
+            and not downmix_command
+            and map_command[1::2] == [f"0:{stream.index}" for stream in probe.streams]
+        ):
+            logger.info("{} No streams to process", SYMBOL_CHECK)
+            input_path, _ = self._get_input_and_output()
+            return input_path
+
         # Add flags to title
         title_flags = []
 
@@ -879,16 +928,13 @@ class VideoFile:
 
         title = f"Process file ({', '.join(title_flags)})" if title_flags else "Process file"
 
-        # Run ffmpeg
+        # Run ffmpeg. Streams are mapped in video, audio, subtitle order so any queued reorder is folded into this pass
         return self._run_ffmpeg(
-            video_map_command
-            + audio_map_command
-            + subtitle_map_command
-            + ["-c", "copy"]
-            + downmix_command,
+            [*map_command, "-c", "copy", *downmix_command],
             title=title,
             step="process",
             dry_run=dry_run,
+            fold_pending=True,
         )
 
     def reorder_streams(
@@ -899,12 +945,15 @@ class VideoFile:
 
         Arrange the streams in the video file so that video streams appear first, followed by audio streams, and then subtitle streams. Exclude certain types of video streams like 'mjpeg' and 'png'.
 
+        The reorder is queued rather than run immediately. It is fused into the next stream-copy pass (e.g. `process_streams`) or run on its own before the next re-encoding step, so the container is only remuxed once.
+
         Returns:
-            Path: Path to the video file with reordered streams.
+            Path: Path to the current input file. The reordered file is produced when the queued step runs.
 
         Raises:
             typer.Exit: If no video or audio streams are found in the video file.
         """
+        self._flush_pending_steps(dry_run=dry_run)
         probe = self._get_probe()
 
         video_streams = [
@@ -927,11 +976,11 @@ class VideoFile:
         # Check if reordering is needed
         reorder = any(
             stream.index != i
-            for i, stream in enumerate(video_streams + audio_streams + subtitle_streams)
+            for i, stream in enumerate(chain(video_streams, audio_streams, subtitle_streams))
         )
 
         if not reorder:
-            logger.info(f"{SYMBOL_CHECK} No streams to reorder")
+            logger.info("{} No streams to reorder", SYMBOL_CHECK)
             input_path, _ = self._get_input_and_output()
             return input_path
 
@@ -941,13 +990,14 @@ class VideoFile:
         # Build the command list using list comprehension and concatenation
         command = initial_command + [
             item
-            for stream_list in [video_streams, audio_streams, subtitle_streams]
-            for stream in stream_list
-            for item in ["-map", f"0:{stream.index}"]
+            for stream in chain(video_streams, audio_streams, subtitle_streams)
+            for item in ("-map", f"0:{stream.index}")
         ]
 
-        # Run ffmpeg
-        return self._run_ffmpeg(command, title="Reorder streams", step="reorder", dry_run=dry_run)
+        # Queue the reorder so it can share a single pass with the next stream-copy step
+        self._pending_steps.append(("Reorder streams", "reorder", command))
+        input_path, _ = self._get_input_and_output()
+        return input_path
 
     def video_to_1080p(self, force: bool = False, dry_run: bool = False) -> Path:
         """Convert the video to 1080p resolution.
@@ -955,6 +1005,7 @@ class VideoFile:
         Returns:
           Path: to the converted video file if the video is not already 1080p. If the video is already 1080p, the original video file path is returned.
         """
+        self._flush_pending_steps(dry_run=dry_run)
         input_path, _ = self._get_input_and_output()
 
         # Get ffprobe probe
@@ -974,7 +1025,7 @@ class VideoFile:
 
         # Return if video is not 4K
         if not force and getattr(video_stream, "width", 0) <= 1920:  # noqa: PLR2004
-            logger.info(f"{SYMBOL_CHECK} No convert to 1080p needed")
+            logger.info("{} No convert to 1080p needed", SYMBOL_CHECK)
             return input_path
 
         # Build ffmpeg command
@@ -990,11 +1041,18 @@ class VideoFile:
         # Run ffmpeg
         return self._run_ffmpeg(command, title="Convert to 1080p", step="1080p", dry_run=dry_run)
 
+    @cached_property
+    def probe(self) -> VideoProbe:
+        """Return the ffprobe probe information for the source video file, computed once per instance."""
+        return VideoProbe.parse_probe_response(ffprobe(self.path), self.stem)
+
     def as_stream_table(self) -> Table:
-        """Return the video probe as a rich table."""
-        probe = self._get_probe()
+        """Return the video probe as a rich table. Only the fields shown in the table are probed."""
+        probe = VideoProbe.parse_probe_response(
+            ffprobe(self.path, fields=FFPROBE_TABLE_ENTRIES), self.stem
+        )
         return probe.as_table()
 
     def ffprobe_json(self) -> dict:
         """Return the ffprobe json response."""
-        return self._get_probe().json_data
+        return self.probe.json_data
@@ -1,28 +1,53 @@
 """Shared utilities."""
 
+from typing import TYPE_CHECKING, Any
+
 from .console import console
 from .helpers import (
     channels_to_layout,
     copy_with_callback,
     existing_file_path,
     ffprobe,
-    query_radarr,
-    query_sonarr,
-    query_tmdb,
+    process_files,
     tmp_to_output,
 )
-from .logging import InterceptHandler, instantiate_logger
+from .logging import instantiate_logger
+
+if TYPE_CHECKING:
+    from .api import query_arr_apps, query_radarr, query_sonarr, query_tmdb  # noqa: TC004
+
+# External API helpers pull in `requests`, so import them only when first accessed
+_LAZY_API_HELPERS = frozenset({"query_arr_apps", "query_radarr", "query_sonarr", "query_tmdb"})
 
 __all__ = [
-    "InterceptHandler",
     "channels_to_layout",
     "console",
     "copy_with_callback",
     "existing_file_path",
     "ffprobe",
     "instantiate_logger",
+    "process_files",
+    "query_arr_apps",
     "query_radarr",
     "query_sonarr",
     "query_tmdb",
     "tmp_to_output",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Lazily import the external API helpers on first access.
+
+    Returns:
+        Any: The requested API helper.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+    if name in _LAZY_API_HELPERS:
+        from . import api  # noqa: PLC0415
+
+        return getattr(api, name)
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
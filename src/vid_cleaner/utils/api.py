@@ -0,0 +1,166 @@
+"""External API queries used to look up video metadata."""
+
+from functools import lru_cache
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter, Retry
+
+from vid_cleaner.config import VidCleanerConfig
+
+from .console import console
+
+# One pooled session keeps connections alive across the many lookups of a batch run
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2)
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+@lru_cache(maxsize=128)
+def _get_json(url: str, params: tuple[tuple[str, str], ...]) -> dict:  # pragma: no cover
+    """Fetch a JSON API response, cached for the rest of the run.
+
+    Failures raise instead of returning an empty result, so lru_cache only stores successful responses and a later lookup of the same query tries again.
+
+    Args:
+        url (str): URL to query
+        params (tuple[tuple[str, str], ...]): Query parameters as hashable key/value pairs
+
+    Returns:
+        dict: The decoded JSON response
+
+    Raises:
+        requests.HTTPError: If the response status is not 200
+    """
+    response = _SESSION.get(url, params=dict(params), timeout=15)
+
+    if response.status_code != 200:  # noqa: PLR2004
+        msg = f"{response.status_code} {response.reason}"
+        raise requests.HTTPError(msg, response=response)
+
+    return response.json()
+
+
+def query_tmdb(search: str, verbosity: int) -> dict:  # pragma: no cover
+    """Query The Movie Database API for a movie title.
+
+    Args:
+        search (str): IMDB id (tt____) to search for
+        verbosity (int): Verbosity level
+
+    Returns:
+        dict: The Movie Database API response
+    """
+    tmdb_api_key = VidCleanerConfig().tmdb_api_key
+
+    if not tmdb_api_key:
+        return {}
+
+    url = f"https://api.themoviedb.org/3/find/{search}"
+
+    params = {
+        "api_key": tmdb_api_key,
+        "language": "en-US",
+        "external_source": "imdb_id",
+    }
+
+    if verbosity > 1:
+        args = "&".join([f"{k}={v}" for k, v in params.items()])
+        logger.trace("TMDB: Querying {}?{}", url, args)
+
+    try:
+        data = _get_json(url, tuple(params.items()))
+    except requests.RequestException as e:
+        logger.error("Error querying The Movie Database API: {}", e)
+        return {}
+
+    logger.trace("TMDB: Response received")
+    if verbosity > 1:
+        console.log(data)
+    return data
+
+
+def query_radarr(search: str) -> dict:  # pragma: no cover
+    """Query Radarr API for a movie title.
+
+    Args:
+        search (str): Movie title to search for
+        api_key (str): Radarr API key
+
+    Returns:
+        dict: Radarr API response
+    """
+    radarr_url = VidCleanerConfig().radarr_url
+    radarr_api_key = VidCleanerConfig().radarr_api_key
+
+    if not radarr_api_key or not radarr_url:
+        return {}
+
+    url = f"{radarr_url}/api/v3/parse"
+    params = {
+        "apikey": radarr_api_key,
+        "title": search,
+    }
+
+    try:
+        return _get_json(url, tuple(params.items()))
+    except requests.RequestException as e:
+        logger.error("Error querying Radarr: {}", e)
+        return {}
+
+
+def query_sonarr(search: str) -> dict:  # pragma: no cover
+    """Query Sonarr API for a movie title.
+
+    Args:
+        search (str): Movie title to search for
+        api_key (str): Radarr API key
+
+    Returns:
+        dict: Sonarr API response
+    """
+    sonarr_url = VidCleanerConfig().sonarr_url
+    sonarr_api_key = VidCleanerConfig().sonarr_api_key
+
+    if not sonarr_api_key or not sonarr_url:
+        return {}
+
+    url = f"{sonarr_url}/api/v3/parse"
+    params = {
+        "apikey": sonarr_api_key,
+        "title": search,
+    }
+
+    try:
+        data = _get_json(url, tuple(params.items()))
+    except requests.RequestException as e:
+        logger.error("Error querying Sonarr: {}", e)
+        return {}
+
+    logger.trace("SONARR: Response received")
+    return data
+
+
+def query_arr_apps(search: str) -> str | None:  # pragma: no cover
+    """Find the IMDb ID of a title with Radarr, falling back to Sonarr.
+
+    Sonarr is only queried when Radarr does not know the title, so a movie costs a single request and never logs a Sonarr error when Sonarr is unreachable or not configured.
+
+    Args:
+        search (str): Title to search for
+
+    Returns:
+        str | None: The IMDb ID if either app knows the title, otherwise None
+    """
+    response = query_radarr(search)
+    if response and "movie" in response and "imdbId" in response["parsedMovieInfo"]:
+        return response["movie"]["imdbId"]
+
+    response = query_sonarr(search)
+    if response and "series" in response and "imdbId" in response["series"]:
+        return response["series"]["imdbId"]
+
+    return None
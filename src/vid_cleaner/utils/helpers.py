@@ -1,21 +1,41 @@
 """Helper functions for vid-cleaner."""
 
 import io
+import json
+import os
 import shutil
-from collections.abc import Callable
+import stat
+import subprocess  # noqa: S404
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any, TypeVar
 
-import ffmpeg as python_ffmpeg
-import requests
 import typer
 from loguru import logger
-from rich.progress import Progress
-
-from vid_cleaner.config import VidCleanerConfig
-from vid_cleaner.constants import BUFFER_SIZE, AudioLayout
+from rich.progress import (
+    BarColumn,
+    FileSizeColumn,
+    Progress,
+    TextColumn,
+    TotalFileSizeColumn,
+    TransferSpeedColumn,
+)
+
+from vid_cleaner.constants import (
+    AUDIO_LAYOUT_VALUES,
+    BUFFER_SIZE,
+    PROGRESS_UPDATE_INTERVAL,
+    AudioLayout,
+)
 from vid_cleaner.utils import errors
+from vid_cleaner.utils.console import console
+from vid_cleaner.utils.logging import instantiate_logger, logger_settings
 
-from .console import console
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def channels_to_layout(channels: int) -> AudioLayout | None:
@@ -39,7 +59,7 @@ def channels_to_layout(channels: int) -> AudioLayout | None:
         <AudioLayout.SURROUND7: 8>
         >>> channels_to_layout(3)
     """
-    if channels in [layout.value for layout in AudioLayout]:
+    if channels in AUDIO_LAYOUT_VALUES:
         return AudioLayout(channels)
 
     if channels == 5:  # noqa: PLR2004
@@ -51,166 +71,161 @@ def channels_to_layout(channels: int) -> AudioLayout | None:
     return None
 
 
-def existing_file_path(path: str) -> Path:
-    """Check if the given path exists and is a file.
+def default_jobs(num_files: int) -> int:
+    """Return the default number of files to process in parallel.
+
+    Each file is processed by an ffmpeg or ffprobe subprocess, so use a quarter of the available cores and never more workers than files.
 
     Args:
-        path (str): The path to check.
+        num_files (int): Number of files to process
 
     Returns:
-        Path: The resolved path if it exists and is a file.
-
-    Raises:
-        typer.BadParameter: If the path does not exist or is not a file.
+        int: Number of parallel jobs, at least 1
     """
-    resolved_path = Path(path).expanduser().resolve()
+    return max(1, min(num_files, (os.cpu_count() or 1) // 4))
 
-    if not resolved_path.exists():
-        msg = f"File {path!s} does not exist"
-        raise typer.BadParameter(msg)
 
-    if not resolved_path.is_file():
-        msg = f"{path!s} is not a file"
-        raise typer.BadParameter(msg)
+def _init_worker(logger_kwargs: dict[str, Any]) -> None:
+    """Prepare a pool worker process before it processes any items.
 
-    return resolved_path
-
-
-def ffprobe(path: Path) -> dict:  # pragma: no cover
-    """Probe video file and return a dict.
+    Workers started with the spawn or forkserver methods do not inherit loguru's sinks, so logging is configured with the parent's settings. Progress bars are disabled because worker output is captured and printed by the parent once each item finishes.
 
     Args:
-        path (Path): Path to video file
-
-    Returns:
-        dict: A dictionary containing information about the video file.
-
-    Raises:
-        typer.Exit: If an error occurs while probing the video file.
+        logger_kwargs (dict[str, Any]): Keyword arguments for `instantiate_logger`. Empty if logging is not configured.
     """
-    try:
-        probe = python_ffmpeg.probe(path)
-    except python_ffmpeg.Error as e:
-        logger.error(e.stderr)
-        raise typer.Exit(1) from e
+    console.is_interactive = False
 
-    return probe
+    if logger_kwargs:
+        instantiate_logger(**logger_kwargs)
 
 
-def query_tmdb(search: str, verbosity: int) -> dict:  # pragma: no cover
-    """Query The Movie Database API for a movie title.
+def _run_captured(func: Callable[[T], R], item: T) -> tuple[R, str]:
+    """Apply a function to an item in a pool worker, capturing its console output.
+
+    If `func` raises, the output captured so far is printed before the exception propagates to the parent.
 
     Args:
-        search (str): IMDB id (tt____) to search for
-        verbosity (int): Verbosity level
+        func (Callable[[T], R]): The function to apply
+        item (T): The item to process
 
     Returns:
-        dict: The Movie Database API response
+        tuple[R, str]: The result of `func` and everything it printed to the console
     """
-    tmdb_api_key = VidCleanerConfig().tmdb_api_key
+    capture = console.capture()
+    try:
+        with capture:
+            result = func(item)
+    except BaseException:
+        # Print what was captured so the logs explaining the failure are not lost
+        console.file.write(capture.get())
+        raise
 
-    if not tmdb_api_key:
-        return {}
+    return result, capture.get()
 
-    url = f"https://api.themoviedb.org/3/find/{search}"
 
-    params = {
-        "api_key": tmdb_api_key,
-        "language": "en-US",
-        "external_source": "imdb_id",
-    }
+def process_files(func: Callable[[T], R], items: list[T], jobs: int | None = None) -> Iterator[R]:
+    """Apply a function to each item, in parallel processes when more than one job is requested.
 
-    if verbosity > 1:
-        args = "&".join([f"{k}={v}" for k, v in params.items()])
-        logger.trace(f"TMDB: Querying {url}?{args}")
+    Results are yielded in the order of `items`. With a single job or a single item, items are processed serially in the current process. In parallel, each worker captures the console output of an item, including logs and dry run commands, and the parent prints it as one block before yielding the result so output from different files never interleaves.
 
-    try:
-        response = requests.get(url, params=params, timeout=15)
-    except Exception as e:  # noqa: BLE001
-        logger.error(e)
-        return {}
+    Args:
+        func (Callable[[T], R]): A picklable, module-level function to apply to each item
+        items (list[T]): Items to process
+        jobs (int | None, optional): Number of parallel processes. Defaults to `default_jobs(len(items))`.
 
-    if response.status_code != 200:  # noqa: PLR2004
-        logger.error(
-            f"Error querying The Movie Database API: {response.status_code} {response.reason}",
-        )
-        return {}
+    Yields:
+        R: The result of `func` for each item
+    """
+    jobs = jobs or default_jobs(len(items))
 
-    logger.trace("TMDB: Response received")
-    if verbosity > 1:
-        console.log(response.json())
-    return response.json()
+    if jobs <= 1 or len(items) <= 1:
+        yield from map(func, items)
+        return
 
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(items)),
+        initializer=_init_worker,
+        initargs=(logger_settings(),),
+    ) as executor:
+        for result, output in executor.map(partial(_run_captured, func), items):
+            console.file.write(output)
+            yield result
 
-def query_radarr(search: str) -> dict:  # pragma: no cover
-    """Query Radarr API for a movie title.
+
+def existing_file_path(path: str) -> Path:
+    """Check if the given path exists and is a file.
 
     Args:
-        search (str): Movie title to search for
-        api_key (str): Radarr API key
+        path (str): The path to check.
 
     Returns:
-        dict: Radarr API response
-    """
-    radarr_url = VidCleanerConfig().radarr_url
-    radarr_api_key = VidCleanerConfig().radarr_api_key
-
-    if not radarr_api_key or not radarr_url:
-        return {}
+        Path: The resolved path if it exists and is a file.
 
-    url = f"{radarr_url}/api/v3/parse"
-    params = {
-        "apikey": radarr_api_key,
-        "title": search,
-    }
+    Raises:
+        typer.BadParameter: If the path does not exist or is not a file.
+    """
+    resolved_path = Path(path).expanduser().resolve()
 
+    # A single stat answers both "exists" and "is a regular file"
     try:
-        response = requests.get(url, params=params, timeout=15)
-    except Exception as e:  # noqa: BLE001
-        logger.error(e)
-        return {}
+        file_stat = resolved_path.stat()
+    except OSError as e:
+        # Also covers paths below a regular file, which raise NotADirectoryError
+        msg = f"File {path!s} does not exist"
+        raise typer.BadParameter(msg) from e
 
-    if response.status_code != 200:  # noqa: PLR2004
-        logger.error(f"Error querying Radarr: {response.status_code} {response.reason}")
-        return {}
+    if not stat.S_ISREG(file_stat.st_mode):
+        msg = f"{path!s} is not a file"
+        raise typer.BadParameter(msg)
+
+    return resolved_path
 
-    return response.json()
 
+def ffprobe(path: Path, fields: str | None = None) -> dict:
+    """Probe video file and return a dict.
 
-def query_sonarr(search: str) -> dict:  # pragma: no cover
-    """Query Sonarr API for a movie title.
+    Results are cached on the file's path, size and modification time so repeated probes of an unchanged file within a run do not spawn ffprobe again. The cache holds the raw JSON text and every call parses its own dict, so callers may change the result freely.
 
     Args:
-        search (str): Movie title to search for
-        api_key (str): Radarr API key
+        path (Path): Path to video file
+        fields (str | None, optional): An ffprobe `-show_entries` specification to limit the probe to specific fields. Defaults to None, which returns the full format and stream information.
 
     Returns:
-        dict: Sonarr API response
+        dict: A dictionary containing information about the video file.
     """
-    sonarr_url = VidCleanerConfig().sonarr_url
-    sonarr_api_key = VidCleanerConfig().sonarr_api_key
+    stat = path.stat()
+    return json.loads(_ffprobe_cached(str(path), stat.st_size, stat.st_mtime_ns, fields))
 
-    if not sonarr_api_key or not sonarr_url:
-        return {}
 
-    url = f"{sonarr_url}/api/v3/parse"
-    params = {
-        "apikey": sonarr_api_key,
-        "title": search,
-    }
+@lru_cache(maxsize=128)
+def _ffprobe_cached(path: str, size: int, mtime_ns: int, fields: str | None) -> str:  # noqa: ARG001  # pragma: no cover
+    """Run ffprobe on a video file. Size and modification time are only used as cache keys.
 
-    try:
-        response = requests.get(url, params=params, timeout=15)
-    except Exception as e:  # noqa: BLE001
-        logger.error(e)
-        return {}
+    Args:
+        path (str): Path to video file
+        size (int): File size in bytes
+        mtime_ns (int): File modification time in nanoseconds
+        fields (str | None): An ffprobe `-show_entries` specification, or None for the full probe
+
+    Returns:
+        str: The JSON output of ffprobe. Immutable, so the cached value can never be changed by a caller.
+
+    Raises:
+        typer.Exit: If an error occurs while probing the video file.
+    """
+    entries = ["-show_entries", fields] if fields else ["-show_format", "-show_streams"]
+    # Errors go to stderr so they can be reported while stdout stays valid JSON
+    cmd = ["ffprobe", "-v", "error", "-print_format", "json", *entries, path]
 
-    if response.status_code != 200:  # noqa: PLR2004
-        logger.error(f"Error querying Sonarr: {response.status_code} {response.reason}")
-        return {}
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=True, text=True)  # noqa: S603
+    except subprocess.CalledProcessError as e:
+        logger.error(
+            "ffprobe failed on {} (exit code {}): {}", path, e.returncode, e.stderr.strip()
+        )
+        raise typer.Exit(1) from e
 
-    logger.trace("SONARR: Response received")
-    return response.json()
+    return result.stdout
 
 
 def _copyfileobj(
@@ -243,6 +258,53 @@ def _copyfileobj(
             callback(copied)
 
 
+def _copy_file_range(
+    src_bytes: io.BufferedReader,
+    dest_bytes: io.BufferedWriter,
+    callback: Callable,
+    length: int,
+) -> bool:
+    """Copy bytes between files in the kernel with `os.copy_file_range`, with callback support.
+
+    Avoids moving file data through userspace buffers on platforms which support it (Linux).
+
+    Args:
+        src_bytes: The source file from which to read bytes.
+        dest_bytes: The destination file to which bytes are written.
+        callback: A callable that is invoked after each chunk of bytes is copied. The callable
+                  should accept a single argument, which is the total number of bytes copied so far.
+        length: The size of each chunk of bytes to be copied at a time.
+
+    Returns:
+        bool: True if the file was copied, False if the platform or filesystem does not support `copy_file_range` and nothing was copied. A filesystem which reports 0 bytes copied for a non-empty file counts as unsupported.
+
+    Raises:
+        OSError: If the copy fails after some bytes have already been copied.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+
+    src_fd, dest_fd = src_bytes.fileno(), dest_bytes.fileno()
+    copied = 0
+    while True:
+        try:
+            sent = copy_file_range(src_fd, dest_fd, length)
+        except OSError:
+            if copied:
+                raise
+            return False
+
+        if not sent:
+            break
+        copied += sent
+        if callback is not None:
+            callback(copied)
+
+    # Some filesystems report 0 bytes copied instead of raising, so fall back to a userspace copy
+    return bool(copied) or not os.fstat(src_fd).st_size
+
+
 def copy_with_callback(
     src: Path,
     dest: Path,
@@ -292,34 +354,73 @@ def copy_with_callback(
         raise ValueError(msg)
 
     with src.open("rb") as src_bytes, dest.open("wb") as dest_bytes:
-        _copyfileobj(src_bytes, dest_bytes, callback=callback, length=buffer_size)
+        if not _copy_file_range(src_bytes, dest_bytes, callback=callback, length=buffer_size):
+            _copyfileobj(src_bytes, dest_bytes, callback=callback, length=buffer_size)
 
     shutil.copymode(str(src), str(dest))
 
     return dest
 
 
+def _reserve_output(parent: Path, stem: str, suffix: str) -> Path:
+    """Claim a free output file name by creating it as an empty file.
+
+    Try `stem`, then `stem_1`, `stem_2` and so on. Each name is created with `O_CREAT | O_EXCL` so parallel workers writing to the same directory can never pick the same name and overwrite each other's output.
+
+    Args:
+        parent: The directory for the output file.
+        stem: The base name of the output file.
+        suffix: The suffix of the output file.
+
+    Returns:
+        Path: The path to the new, empty output file.
+    """
+    # List the directory once so the common case needs a single create attempt
+    with os.scandir(parent) as entries:
+        existing = {entry.name for entry in entries}
+
+    i = 0
+    while True:
+        name = f"{stem}_{i}{suffix}" if i else f"{stem}{suffix}"
+        i += 1
+        if name in existing:
+            continue
+
+        new = parent / name
+        try:
+            os.close(os.open(new, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            continue
+
+        return new
+
+
 def tmp_to_output(
     tmp_file: Path,
     stem: str,
     overwrite: bool = False,
     new_file: Path | None = None,
+    copy: bool = False,
 ) -> Path:
-    """Copy a temporary file to an output location with optional renaming and overwrite control.
+    """Move a temporary file to an output location with optional renaming and overwrite control.
 
-    This function copies a temporary file to a specified output location. If the output file path is not provided, the function uses the current working directory and the provided stem for the file name. If the target file exists and overwrite is False, the function will append a number to the stem to create a unique filename.
+    This function moves a temporary file to a specified output location. If the output file path is not provided, the function uses the current working directory and the provided stem for the file name. If the target file exists and overwrite is False, the function will append a number to the stem to create a unique filename.
 
     Args:
-        tmp_file: The path to the temporary input file to be copied.
+        tmp_file: The path to the temporary input file to be moved.
         stem: The base name (stem) to use for the output file if `new_file` is not provided. If `new_file` is provided, `stem` is ignored.
         overwrite: A flag to indicate whether to overwrite the output file if it already exists. If False and the file exists, a number is appended to the file's stem to avoid overwriting.
-        new_file: An optional path to the output file. If provided, this path is used as the target for the copy operation, and `stem` is ignored.
+        new_file: An optional path to the output file. If provided, this path is used as the target for the move operation, and `stem` is ignored.
+        copy: Copy the file and leave `tmp_file` in place instead of moving it. Use this to write a file which must be kept, such as an unchanged input video.
 
     Returns:
-        The path to the output file where the temporary file has been copied.
+        The path to the output file where the temporary file has been moved.
+
+    Raises:
+        typer.Exit: If the copied output is smaller or larger than the temporary file. The partial output is removed and the temporary file is kept.
 
     Note:
-        This function uses a progress bar to indicate the copy progress and handles file naming conflicts by appending a number to the file stem if `overwrite` is False.
+        When the temporary file and the output location are on the same filesystem the file is renamed in place. Otherwise it is copied with a progress bar and the temporary file is removed. File naming conflicts are handled by appending a number to the file stem if `overwrite` is False. The name is reserved on disk before the file is written, so parallel workers never share an output file.
     """
     # When a path is given, use that
     if new_file:
@@ -331,23 +432,55 @@ def tmp_to_output(
     # Ensure parent directory exists
     parent.mkdir(parents=True, exist_ok=True)
 
-    new = parent / f"{stem}{tmp_file.suffix}"
+    new = (
+        parent / f"{stem}{tmp_file.suffix}"
+        if overwrite
+        else _reserve_output(parent, stem, tmp_file.suffix)
+    )
+
+    tmp_file_stat = tmp_file.stat()
+
+    # A rename on the same filesystem is O(1) and avoids copying the file data
+    if not copy and tmp_file_stat.st_dev == parent.stat().st_dev:
+        tmp_file.replace(new)
+        logger.trace("File moved to {}", new)
+        return new
+
+    tmp_file_size = tmp_file_stat.st_size
+
+    with Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        FileSizeColumn(),
+        TextColumn("/"),
+        TotalFileSizeColumn(),
+        TransferSpeedColumn(),
+        console=console,
+        transient=True,
+        disable=not console.is_interactive,
+    ) as progress:
+        task = progress.add_task("Copy file…", total=tmp_file_size)
+        next_update = 0.0
+
+        def _update_progress(total_copied: int) -> None:
+            """Redraw the progress bar at most once per update interval."""
+            nonlocal next_update
+            now = time.monotonic()
+            if now >= next_update or total_copied >= tmp_file_size:
+                progress.update(task, completed=total_copied)
+                next_update = now + PROGRESS_UPDATE_INTERVAL
 
-    if not overwrite:
-        i = 1
-        while new.exists():
-            new = parent / f"{stem}_{i}{tmp_file.suffix}"
-            i += 1
+        copy_with_callback(tmp_file, new, callback=_update_progress)
 
-    tmp_file_size = tmp_file.stat().st_size
+    # Never delete the temporary file unless the output holds all of its data
+    copied_size = new.stat().st_size
+    if copied_size != tmp_file_size:
+        logger.error("Incomplete copy to {}: {} of {} bytes", new, copied_size, tmp_file_size)
+        new.unlink()
+        raise typer.Exit(1)
 
-    with Progress(transient=True) as progress:
-        task = progress.add_task("Copy file…", total=tmp_file_size)
-        copy_with_callback(
-            tmp_file,
-            new,
-            callback=lambda total_copied: progress.update(task, completed=total_copied),
-        )
+    if not copy:
+        tmp_file.unlink()
 
-    logger.trace(f"File copied to {new}")
+    logger.trace("File copied to {}", new)
     return new
@@ -4,6 +4,7 @@ import logging
 import sys
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
 from rich.markup import escape
@@ -12,6 +13,9 @@ from vid_cleaner.config import VidCleanerConfig
 
 from .console import console
 
+# Arguments of the most recent instantiate_logger call, used to configure pool worker processes the same way
+_LOGGER_SETTINGS: dict[str, Any] = {}
+
 
 class LogLevel(Enum):
     """Log levels for vid-cleaner."""
@@ -103,10 +107,12 @@ def instantiate_logger(
         colorize=True,
         format=log_formatter,  # type: ignore [arg-type]
     )
-    if log_to_file:
-        if log_file is None:
-            log_file = VidCleanerConfig().log_file
+    if log_to_file and log_file is None:
+        log_file = VidCleanerConfig().log_file
+
+    _LOGGER_SETTINGS.update(verbosity=verbosity, log_file=log_file, log_to_file=log_to_file)
 
+    if log_to_file:
         logger.add(
             log_file,
             level=LogLevel(level).name,
@@ -122,6 +128,17 @@ def instantiate_logger(
         logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
 
 
+def logger_settings() -> dict[str, Any]:
+    """Return the arguments of the most recent `instantiate_logger` call.
+
+    Worker processes started with the spawn or forkserver methods begin with loguru's default sink, so pass these to `instantiate_logger` in each worker to keep the verbosity, format and log file of the parent.
+
+    Returns:
+        dict[str, Any]: The `instantiate_logger` keyword arguments, or an empty dict if logging has not been configured.
+    """
+    return dict(_LOGGER_SETTINGS)
+
+
 class InterceptHandler(logging.Handler):  # pragma: no cover
     """Intercepts standard logging and redirects to Loguru.
 
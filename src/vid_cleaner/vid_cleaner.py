@@ -10,7 +10,7 @@ from loguru import logger
 from pydantic import ValidationError
 
 from vid_cleaner.cli import clean, clip, inspect
-from vid_cleaner.constants import CONFIG_PATH, VERSION, VideoContainerTypes
+from vid_cleaner.constants import CONFIG_PATH, VERSION, VIDEO_SUFFIXES, VideoContainerTypes
 from vid_cleaner.models import VideoFile
 from vid_cleaner.utils import (
     console,
@@ -50,6 +50,32 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def validate_config() -> None:
+    """Create the default configuration file if needed and validate the configuration.
+
+    Called only by code paths which read settings, so commands like `inspect` and every `--help` never create or parse the configuration file.
+
+    Raises:
+        typer.Exit: If the configuration file is invalid
+    """
+    # Create a default configuration file if one does not exist
+    if not CONFIG_PATH.exists():
+        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        default_config_file = Path(__file__).parent.resolve() / "default_config.toml"
+        shutil.copy(default_config_file, CONFIG_PATH)
+        logger.info("Created default configuration file at '{}'", CONFIG_PATH)
+        logger.info("Edit this file to configure your default settings. Exiting.")
+
+    # Load and validate configuration
+    try:
+        validate_all_configs()
+    except ValidationError as e:
+        logger.error("Invalid configuration file: {}", CONFIG_PATH)
+        for error in e.errors():
+            console.print(f"           [red]{error['loc'][0]}: {error['msg']}[/red]")
+        raise typer.Exit(code=1) from e
+
+
 def parse_video_input(path: str) -> VideoFile:
     """Takes a string of a path and converts it to a VideoFile object.
 
@@ -60,8 +86,8 @@ def parse_video_input(path: str) -> VideoFile:
         typer.BadParameter: If the file is not a supported video
     """
     file_path = existing_file_path(path)
-    if file_path.suffix not in VideoContainerTypes.__members__.values():
-        msg = f"Vidcleaner supports {', '.join(VideoContainerTypes.__members__.values())} files.  '{file_path.suffix}' is not supported."
+    if file_path.suffix.lower() not in VIDEO_SUFFIXES:
+        msg = f"Vidcleaner supports {', '.join(container.value for container in VideoContainerTypes)} files.  '{file_path.suffix}' is not supported."
         raise typer.BadParameter(msg)
 
     return VideoFile(file_path)
@@ -82,6 +108,16 @@ def inspect_command(
         ),
     ],
     json: Annotated[bool, typer.Option(help="Output in JSON format")] = False,
+    jobs: Annotated[
+        Optional[int],
+        typer.Option(
+            "--jobs",
+            "-j",
+            help=r"Number of files to process in parallel [#888888]\[default: based on CPU count][/#888888]",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """Inspect video files to display detailed stream information.
 
@@ -90,7 +126,7 @@ def inspect_command(
     and audio channel details. This command is useful for understanding the
     composition of a video file before performing operations like clipping or transcoding.
     """
-    inspect(files, json_output=json)
+    inspect(files, json_output=json, jobs=jobs)
 
 
 @app.command("clip")
@@ -124,6 +160,16 @@ def clip_command(
     dry_run: Annotated[
         bool, typer.Option("--dry-run", "-n", help="Show ffmpeg commands without executing")
     ] = False,
+    jobs: Annotated[
+        Optional[int],
+        typer.Option(
+            "--jobs",
+            "-j",
+            help=r"Number of files to process in parallel [#888888]\[default: based on CPU count][/#888888]",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """Clip a section from a video file.
 
@@ -134,7 +180,7 @@ def clip_command(
 
     Use the [code]--overwrite[/code] option to overwrite the output file if it already exists.
     """
-    clip(files, start, duration, out, overwrite, dry_run)
+    clip(files, start, duration, out, overwrite, dry_run, jobs=jobs)
 
 
 @docstring_parameter(CONFIG_PATH)
@@ -235,6 +281,16 @@ def clean_command(
     dry_run: Annotated[
         bool, typer.Option("--dry-run", "-n", help="Show ffmpeg commands without executing")
     ] = False,
+    jobs: Annotated[
+        Optional[int],
+        typer.Option(
+            "--jobs",
+            "-j",
+            help=r"Number of files to process in parallel [#888888]\[default: based on CPU count][/#888888]",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """Transcode video files to different formats or configurations.
 
@@ -258,6 +314,13 @@ def clean_command(
     [#999999]Downmix audio to stereo and keep all subtitles:[/#999999]
     vidcleaner clean --downmix --keep-subs <video_file>
     """
+    # Reject conflicting options before touching any file
+    if h265 and vp9:
+        msg = "Cannot convert to both H265 and VP9"
+        raise typer.BadParameter(msg)
+
+    validate_config()
+
     clean(
         files=files,
         out=out,
@@ -275,6 +338,7 @@ def clean_command(
         force=force,
         dry_run=dry_run,
         verbosity=ctx.meta["verbosity"],
+        jobs=jobs,
     )
 
 
@@ -351,26 +415,16 @@ def main(
         [#999999]Downmix audio to stereo and keep all subtitles:[/#999999]
         vidcleaner clean --downmix --keep-subs <video_file>
     """  # noqa: D301
-    # Instantiate Logging
-    instantiate_logger(verbosity, log_file, log_to_file)
-    ctx.meta["verbosity"] = verbosity
+    # Log to the console first so configuration errors are reported in the app's format
+    instantiate_logger(verbosity, log_file=None, log_to_file=False)
 
-    # Create a default configuration file if one does not exist
-    if not CONFIG_PATH.exists():
-        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        default_config_file = Path(__file__).parent.resolve() / "default_config.toml"
-        shutil.copy(default_config_file, CONFIG_PATH)
-        logger.info(f"Created default configuration file at '{CONFIG_PATH}'")
-        logger.info("Edit this file to configure your default settings. Exiting.")
+    # Only read the configuration here when the log file path must come from it
+    if log_to_file:
+        if log_file is None:
+            validate_config()
+        instantiate_logger(verbosity, log_file, log_to_file)
 
-    # Load and validate configuration
-    try:
-        validate_all_configs()
-    except ValidationError as e:
-        logger.error(f"Invalid configuration file: {CONFIG_PATH}")
-        for error in e.errors():
-            console.print(f"           [red]{error['loc'][0]}: {error['msg']}[/red]")
-        raise typer.Exit(code=1) from e
+    ctx.meta["verbosity"] = verbosity
 
 
 if __name__ == "__main__":
@@ -1,19 +1,32 @@
 # type: ignore
 """Shared fixtures."""
 
-import json
+import copy
+from functools import cache
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
+import tomllib
 from confz import DataSource, FileSource
+from iso639 import Lang
 from loguru import logger
 
+from tests.fixtures._data import FFPROBE_FIXTURES
+from vid_cleaner.config import VidCleanerConfig
 from vid_cleaner.models.video_file import VideoFile
 from vid_cleaner.utils import console
 
 logger.remove()  # Remove default logger
 
 FIXTURE_CONFIG = Path(__file__).resolve().parent.parent / "src/vid_cleaner/default_config.toml"
+FFMPEG_PROGRESS = (0, 25, 50, 75, 100)
+
+
+@cache
+def _lang(code: str) -> Lang:
+    """Return the Lang for a language code, built once per code. Lang is an immutable tuple, so sharing it is safe."""
+    return Lang(code)
 
 
 @pytest.fixture
@@ -35,23 +48,25 @@ def mock_ffmpeg(mocker):
     Returns:
         Mock: A mock object for the FfmpegProgress class.
     """
-    mock_ffmpeg_progress = mocker.patch(
-        "vid_cleaner.models.video_file.FfmpegProgress", autospec=True
-    )
+    # A plain mock avoids autospec introspecting FfmpegProgress for every test
+    mock_ffmpeg_progress = mocker.patch("vid_cleaner.models.video_file.FfmpegProgress")
     mock_instance = mock_ffmpeg_progress.return_value
-    mock_instance.run_command_with_progress.return_value = iter([0, 25, 50, 75, 100])
+    # Hand out a fresh progress iterator for every ffmpeg run
+    mock_instance.run_command_with_progress.side_effect = lambda *_, **__: iter(FFMPEG_PROGRESS)
     return mock_ffmpeg_progress
 
 
-@pytest.fixture
-def mock_video(tmp_path):
+@pytest.fixture(scope="module")
+def mock_video(tmp_path_factory):
     """Fixture to return a VideoFile instance with a specified path.
 
+    The dummy file is created once per test module. Tests only pass its path to the CLI, which builds its own VideoFile, so the instance is never mutated.
+
     Returns:
         VideoFile: A VideoFile instance with a specified path.
     """
     # GIVEN a VideoFile instance with a specified path
-    test_path = Path(tmp_path / "test_video.mp4")
+    test_path = tmp_path_factory.mktemp("video") / "test_video.mp4"
     test_path.touch()  # Create a dummy file
     return VideoFile(test_path)
 
@@ -62,8 +77,14 @@ def _change_test_dir(monkeypatch, tmp_path) -> None:
     monkeypatch.chdir(tmp_path)
 
 
+@pytest.fixture(scope="session")
+def default_config_data():
+    """Return the fixture configuration file parsed once per session."""
+    return tomllib.loads(FIXTURE_CONFIG.read_text())
+
+
 @pytest.fixture
-def mock_config(tmp_path):
+def mock_config(tmp_path, default_config_data):
     """Mock specific configuration data for use in tests by accepting arbitrary keyword arguments.
 
     The function dynamically collects provided keyword arguments, filters out any that are None,
@@ -85,24 +106,36 @@ def mock_config(tmp_path):
             **kwargs: Arbitrary keyword arguments representing configuration settings.
 
         Returns:
-            list: A list containing a FileSource initialized with the fixture configuration and a DataSource with the overridden data.
+            list: A list containing the base configuration source and a DataSource with the overridden data.
         """
         # Filter out None values from kwargs
         override_data = {key: value for key, value in kwargs.items() if value is not None}
 
         # If a 'config.toml' file exists in the test directory, use it as the configuration source
         if Path(tmp_path / "config.toml").exists():
-            config_file_source = str(tmp_path / "config.toml")
+            config_source = FileSource(str(tmp_path / "config.toml"))
+        elif "config_file" in kwargs:
+            config_source = FileSource(kwargs["config_file"])
         else:
-            # Check for 'config_file' in kwargs and use it if present, else default to FIXTURE_CONFIG
-            config_file_source = kwargs.get("config_file", FIXTURE_CONFIG)
+            # The fixture configuration is static, so reuse the session's parsed copy
+            config_source = DataSource(data=default_config_data)
 
         # Return a list of data sources with the overridden configuration
-        return [FileSource(config_file_source), DataSource(data=override_data)]
+        return [config_source, DataSource(data=override_data)]
 
     return _inner
 
 
+@pytest.fixture(autouse=True)
+def _default_config(mock_config):
+    """Run every test against the fixture configuration.
+
+    The override is scoped to the test and restored afterwards. Tests that need other values can nest their own `VidCleanerConfig.change_config_sources(mock_config(...))` block.
+    """
+    with VidCleanerConfig.change_config_sources(mock_config()):
+        yield
+
+
 @pytest.fixture
 def debug():
     """Print debug information to the console. This is used to debug tests while writing them."""
@@ -135,21 +168,42 @@ def debug():
     return _debug_inner
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ffprobe():
     """Return mocked JSON response from ffprobe."""
 
     def _inner(filename: str):
-        fixture = Path(__file__).resolve().parent / "fixtures/ffprobe" / filename
+        # Each test gets its own copy so mutations don't leak into the shared fixture data
+        return copy.deepcopy(FFPROBE_FIXTURES[filename])
+
+    return _inner
+
+
+@pytest.fixture
+def patched_video_file(mocker, mock_ffprobe):
+    """Install the patches shared by the clean command tests in one call.
 
-        cleaned_content = []  # Remove comments from JSON
-        with fixture.open() as f:
-            for line in f.readlines():
-                # Remove comments
-                if "//" in line:
-                    continue
-                cleaned_content.append(line)
+    Usage:
+        def test_something(patched_video_file):
+            mocks = patched_video_file("reference.json", language="fr")
+            do_something()
+            mocks.tmp_to_output.assert_called_once()
+
+    Returns:
+        Callable: A function that patches ffprobe, tmp_to_output and the original language lookup and returns the mocks.
+    """
 
-        return json.loads("".join(line for line in cleaned_content))
+    def _inner(probe_fixture: str, language: str = "en") -> SimpleNamespace:
+        return SimpleNamespace(
+            ffprobe=mocker.patch(
+                "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe(probe_fixture)
+            ),
+            tmp_to_output=mocker.patch(
+                "vid_cleaner.cli.clean.tmp_to_output", return_value="cleaned_video.mkv"
+            ),
+            find_original_language=mocker.patch.object(
+                VideoFile, "_find_original_language", return_value=_lang(language)
+            ),
+        )
 
     return _inner
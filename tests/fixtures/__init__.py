@@ -0,0 +1 @@
+"""Test fixture data."""
@@ -0,0 +1,373 @@
+# type: ignore
+"""Parsed ffprobe fixtures. Generated by `_regen.py` from `ffprobe/*.json`; do not edit by hand."""
+
+FFPROBE_FIXTURES = {
+    "no_stereo.json": {
+        "format": {
+            "bit_rate": "26192239",
+            "duration": "60.268000",
+            "filename": "test_movie.mkv",
+            "format_long_name": "Matroska / WebM",
+            "format_name": "matroska,webm",
+            "size": "197319234",
+            "start_time": "0.000000",
+            "tags": {"ENCODER": "Lavf60.3.100", "title": "Test Move"},
+        },
+        "streams": [
+            {
+                "index": 0,
+                "codec_long_name": "H.264 / AVC / MPEG-4 AVC / MPEG-4 part 10",
+                "codec_name": "h264",
+                "codec_type": "video",
+                "coded_height": 1080,
+                "coded_width": 1920,
+                "height": 1080,
+                "sample_aspect_ratio": "1:1",
+                "start_time": "0.000000",
+                "tags": {
+                    "BPS": "16232147",
+                    "DURATION": "00:01:00.226000000",
+                    "NUMBER_OF_BYTES": "15505439888",
+                    "NUMBER_OF_FRAMES": "183221",
+                    "language": "eng",
+                    "title": "Test Movie",
+                },
+                "width": 1920,
+            },
+            {
+                "index": 1,
+                "codec_name": "truehd",
+                "codec_long_name": "TrueHD",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 8,
+                "channel_layout": "7.1",
+                "start_time": "0.000000",
+                "bits_per_raw_sample": "24",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "3123209",
+                    "NUMBER_OF_FRAMES": "11766956",
+                    "NUMBER_OF_BYTES": "3828195236",
+                    "SOURCE_ID": "001100",
+                    "DURATION": "00:01:00.000000000",
+                },
+            },
+            {
+                "index": 2,
+                "codec_name": "ac3",
+                "codec_long_name": "ATSC A/52A (AC-3)",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 6,
+                "channel_layout": "5.1(side)",
+                "bit_rate": "448000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "448000",
+                    "NUMBER_OF_FRAMES": "306432",
+                    "NUMBER_OF_BYTES": "549126144",
+                    "SOURCE_ID": "001100",
+                    "DURATION": "00:01:00.000000000",
+                },
+            },
+            {
+                "index": 3,
+                "codec_name": "ac3",
+                "codec_long_name": "ATSC A/52A (AC-3)",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 2,
+                "channel_layout": "stereo",
+                "bit_rate": "224000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "224000",
+                    "NUMBER_OF_FRAMES": "306432",
+                    "NUMBER_OF_BYTES": "274563072",
+                    "SOURCE_ID": "001106",
+                    "DURATION": "00:01:00.000000000",
+                    "title": "Director's commentary",
+                },
+            },
+        ],
+    },
+    "reference.json": {
+        "format": {
+            "bit_rate": "26192239",
+            "duration": "60.268000",
+            "filename": "test_movie.mkv",
+            "format_long_name": "Matroska / WebM",
+            "format_name": "matroska,webm",
+            "size": "197319234",
+            "start_time": "0.000000",
+            "tags": {"ENCODER": "Lavf60.3.100", "title": "Test Move"},
+        },
+        "streams": [
+            {
+                "index": 0,
+                "codec_long_name": "H.264 / AVC / MPEG-4 AVC / MPEG-4 part 10",
+                "codec_name": "h264",
+                "codec_type": "video",
+                "coded_height": 1080,
+                "coded_width": 1920,
+                "height": 1080,
+                "sample_aspect_ratio": "1:1",
+                "start_time": "0.000000",
+                "tags": {
+                    "BPS": "16232147",
+                    "DURATION": "00:01:00.226000000",
+                    "NUMBER_OF_BYTES": "15505439888",
+                    "NUMBER_OF_FRAMES": "183221",
+                    "language": "eng",
+                    "title": "Test Movie",
+                },
+                "width": 1920,
+            },
+            {
+                "index": 1,
+                "codec_name": "truehd",
+                "codec_long_name": "TrueHD",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 8,
+                "channel_layout": "7.1",
+                "start_time": "0.000000",
+                "bits_per_raw_sample": "24",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "3123209",
+                    "NUMBER_OF_FRAMES": "11766956",
+                    "NUMBER_OF_BYTES": "3828195236",
+                    "SOURCE_ID": "001100",
+                    "DURATION": "00:01:00.000000000",
+                },
+            },
+            {
+                "index": 2,
+                "codec_name": "ac3",
+                "codec_long_name": "ATSC A/52A (AC-3)",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 6,
+                "channel_layout": "5.1(side)",
+                "bit_rate": "448000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "448000",
+                    "NUMBER_OF_FRAMES": "306432",
+                    "NUMBER_OF_BYTES": "549126144",
+                    "SOURCE_ID": "001100",
+                    "DURATION": "00:01:00.000000000",
+                },
+            },
+            {
+                "index": 3,
+                "codec_name": "ac3",
+                "codec_long_name": "ATSC A/52A (AC-3)",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 6,
+                "channel_layout": "5.1(side)",
+                "bit_rate": "640000",
+                "tags": {
+                    "language": "fre",
+                    "BPS": "640000",
+                    "NUMBER_OF_FRAMES": "306432",
+                    "NUMBER_OF_BYTES": "784465920",
+                    "SOURCE_ID": "001101",
+                    "DURATION": "00:01:00.023000000",
+                },
+            },
+            {
+                "index": 4,
+                "codec_name": "ac3",
+                "codec_long_name": "ATSC A/52A (AC-3)",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 2,
+                "channel_layout": "stereo",
+                "bit_rate": "224000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "224000",
+                    "NUMBER_OF_FRAMES": "306432",
+                    "NUMBER_OF_BYTES": "274563072",
+                    "SOURCE_ID": "001106",
+                    "DURATION": "00:01:00.000000000",
+                },
+            },
+            {
+                "index": 5,
+                "codec_name": "ac3",
+                "codec_long_name": "ATSC A/52A (AC-3)",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 2,
+                "channel_layout": "stereo",
+                "bit_rate": "224000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "224000",
+                    "NUMBER_OF_FRAMES": "306432",
+                    "NUMBER_OF_BYTES": "274563072",
+                    "SOURCE_ID": "001106",
+                    "DURATION": "00:01:00.000000000",
+                    "title": "Director's commentary",
+                },
+            },
+            {
+                "index": 6,
+                "codec_name": "hdmv_pgs_subtitle",
+                "codec_long_name": "HDMV Presentation Graphic Stream subtitles",
+                "codec_type": "subtitle",
+                "start_time": "0.000000",
+                "duration_ts": 60268,
+                "duration": "60.268000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "33430",
+                    "NUMBER_OF_FRAMES": "3576",
+                    "NUMBER_OF_BYTES": "40688568",
+                    "DURATION": "00:00:59.393000000",
+                },
+            },
+            {
+                "index": 7,
+                "codec_name": "hdmv_pgs_subtitle",
+                "codec_long_name": "HDMV Presentation Graphic Stream subtitles",
+                "codec_type": "subtitle",
+                "start_time": "0.000000",
+                "duration_ts": 60268,
+                "duration": "60.268000",
+                "tags": {
+                    "language": "dan",
+                    "BPS": "28841",
+                    "NUMBER_OF_FRAMES": "3616",
+                    "NUMBER_OF_BYTES": "35234211",
+                    "DURATION": "00:00:59.393000000",
+                },
+            },
+            {
+                "index": 8,
+                "codec_name": "hdmv_pgs_subtitle",
+                "codec_long_name": "HDMV Presentation Graphic Stream subtitles",
+                "codec_type": "subtitle",
+                "start_time": "0.000000",
+                "duration_ts": 60268,
+                "duration": "60.268000",
+                "tags": {
+                    "language": "fre",
+                    "BPS": "28841",
+                    "NUMBER_OF_FRAMES": "3616",
+                    "NUMBER_OF_BYTES": "35234211",
+                    "DURATION": "00:00:59.393000000",
+                },
+            },
+            {
+                "index": 9,
+                "codec_name": "mjpeg",
+                "codec_long_name": "Motion JPEG",
+                "profile": "Baseline",
+                "codec_type": "video",
+                "width": 640,
+                "height": 360,
+                "coded_width": 640,
+                "coded_height": 360,
+                "start_time": "0.000000",
+                "bits_per_raw_sample": "8",
+                "tags": {
+                    "FILENAME": "cover.jpg",
+                    "MIMETYPE": "image/jpeg",
+                    "DURATION": "00:00:00.000000000",
+                },
+            },
+        ],
+    },
+    "wrong_order.json": {
+        "format": {
+            "bit_rate": "26192239",
+            "duration": "60.268000",
+            "filename": "test_movie.mkv",
+            "format_long_name": "Matroska / WebM",
+            "format_name": "matroska,webm",
+            "size": "197319234",
+            "start_time": "0.000000",
+            "tags": {"ENCODER": "Lavf60.3.100", "title": "Test Move"},
+        },
+        "streams": [
+            {
+                "index": 0,
+                "codec_name": "hdmv_pgs_subtitle",
+                "codec_long_name": "HDMV Presentation Graphic Stream subtitles",
+                "codec_type": "subtitle",
+                "start_time": "0.000000",
+                "duration_ts": 60268,
+                "duration": "60.268000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "33430",
+                    "NUMBER_OF_FRAMES": "3576",
+                    "NUMBER_OF_BYTES": "40688568",
+                    "DURATION": "00:00:59.393000000",
+                },
+            },
+            {
+                "index": 1,
+                "codec_name": "ac3",
+                "codec_long_name": "ATSC A/52A (AC-3)",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 6,
+                "channel_layout": "5.1(side)",
+                "bit_rate": "448000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "448000",
+                    "NUMBER_OF_FRAMES": "306432",
+                    "NUMBER_OF_BYTES": "549126144",
+                    "SOURCE_ID": "001100",
+                    "DURATION": "00:01:00.000000000",
+                },
+            },
+            {
+                "index": 2,
+                "codec_long_name": "H.264 / AVC / MPEG-4 AVC / MPEG-4 part 10",
+                "codec_name": "h264",
+                "codec_type": "video",
+                "coded_height": 1080,
+                "coded_width": 1920,
+                "height": 1080,
+                "sample_aspect_ratio": "1:1",
+                "start_time": "0.000000",
+                "tags": {
+                    "BPS": "16232147",
+                    "DURATION": "00:01:00.226000000",
+                    "NUMBER_OF_BYTES": "15505439888",
+                    "NUMBER_OF_FRAMES": "183221",
+                    "language": "eng",
+                    "title": "Test Movie",
+                },
+                "width": 1920,
+            },
+            {
+                "index": 3,
+                "codec_name": "ac3",
+                "codec_long_name": "ATSC A/52A (AC-3)",
+                "codec_type": "audio",
+                "sample_rate": "48000",
+                "channels": 2,
+                "channel_layout": "stereo",
+                "bit_rate": "224000",
+                "tags": {
+                    "language": "eng",
+                    "BPS": "224000",
+                    "NUMBER_OF_FRAMES": "306432",
+                    "NUMBER_OF_BYTES": "274563072",
+                    "SOURCE_ID": "001106",
+                    "DURATION": "00:01:00.000000000",
+                },
+            },
+        ],
+    },
+}
@@ -0,0 +1,31 @@
+# type: ignore
+"""Regenerate `_data.py` from the ffprobe JSON fixtures.
+
+The JSON files in `ffprobe/` remain the documented source of truth. After editing one, run `python -m tests.fixtures._regen && ruff format tests/fixtures/_data.py` from the repository root.
+"""
+
+import json
+import pprint
+from pathlib import Path
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "ffprobe"
+DATA_FILE = Path(__file__).resolve().parent / "_data.py"
+HEADER = '''# type: ignore
+"""Parsed ffprobe fixtures. Generated by `_regen.py` from `ffprobe/*.json`; do not edit by hand."""
+
+'''
+
+
+def main() -> None:
+    """Write every ffprobe JSON fixture, without comment lines, to `_data.py` as a dict literal."""
+    payloads = {}
+    for fixture in sorted(FIXTURE_DIR.glob("*.json")):
+        lines = fixture.read_text().splitlines(keepends=True)
+        payloads[fixture.name] = json.loads("".join(line for line in lines if "//" not in line))
+
+    data = pprint.pformat(payloads, width=100, sort_dicts=False)
+    DATA_FILE.write_text(f"{HEADER}FFPROBE_FIXTURES = {data}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,18 @@
 
 import re
 
+from click.testing import CliRunner
+from typer.main import get_command
+
+from vid_cleaner.vid_cleaner import app
+
+_ANSI_RE = re.compile(r"(?:\x9B|\x1B\[)[0-?]*[ -/]*[@-~]")
+
+
+# Build the click command tree once per test process instead of on every invoke
+cli = get_command(app)
+runner = CliRunner()
+
 
 class Regex:  # noqa: PLW1641
     """Assert that a given string meets some expectations.
@@ -59,5 +71,29 @@ def strip_ansi(text) -> str:
     Returns:
         str: String without ANSI escape sequences.
     """
-    ansi_chars = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -\/]*[@-~]")
-    return ansi_chars.sub("", text)
+    # Most captured output has no escape sequences at all
+    if "\x1b" not in text and "\x9b" not in text:
+        return text
+
+    return _ANSI_RE.sub("", text)
+
+
+def ffmpeg_cmd_contains(call, expected: str) -> bool:
+    """Check whether the ffmpeg command of a mocked FfmpegProgress call contains a substring.
+
+    The joined command is cached on the call object so asserting several substrings against the same call only joins its arguments once. Matches are aligned on argument boundaries, so `-map 0:1` does not match `-map 0:10`.
+
+    Args:
+        call (unittest.mock._Call): A call from `mock_ffmpeg.call_args` or `mock_ffmpeg.call_args_list`.
+        expected (str): The substring to look for.
+
+    Returns:
+        bool: True if the joined command contains the substring as whole arguments, False otherwise.
+    """
+    # A mock call fabricates any missing attribute, so read the instance dict directly
+    command = vars(call).get("_ffmpeg_command")
+    if command is None:
+        command = f" {' '.join(call.args[0])} "
+        call._ffmpeg_command = command
+
+    return f" {expected} " in command
@@ -2,340 +2,273 @@
 """Test the inspect command."""
 
 import pytest
-from iso639 import Lang
-from typer.testing import CliRunner
 
-from tests.pytest_functions import strip_ansi
-from vid_cleaner.config import VidCleanerConfig
+from tests.pytest_functions import cli, ffmpeg_cmd_contains, runner, strip_ansi
 from vid_cleaner.models.video_file import VideoFile
-from vid_cleaner.vid_cleaner import app
 
-runner = CliRunner()
+PROCESS_STREAMS_CASES = (
+    pytest.param(
+        [],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
+        "✔ Process file",
+        id="Defaults (only keep local audio,no commentary)",
+    ),
+    pytest.param(
+        ["--downmix"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
+        "✔ Process file (downmix to stereo)",
+        id="Don't convert audio to stereo when stereo exists",
+    ),
+    pytest.param(
+        ["--keep-commentary"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4 -map 0:5",
+        "✔ Process file (keep commentary)",
+        id="Keep commentary",
+    ),
+    pytest.param(
+        ["--drop-original"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
+        "✔ Process file (drop original audio)",
+        id="Keep local language from config even when dropped",
+    ),
+    pytest.param(
+        ["--langs", "fr,es"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:3 -map 0:4 -map 0:8",
+        "✔ Process file (drop unwanted subtitles)",
+        id="Keep specified languages",
+    ),
+    pytest.param(
+        ["--keep-subs"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4 -map 0:6 -map 0:7 -map 0:8",
+        "✔ Process file (keep subtitles)",
+        id="Keep all subtitles",
+    ),
+    pytest.param(
+        ["--keep-local-subs"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4 -map 0:6",
+        "✔ Process file (drop unwanted subtitles, keep local subtitles)",
+        id="Keep local subtitles",
+    ),
+)
 
+FOREIGN_LANGUAGE_CASES = (
+    pytest.param(
+        [],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:3 -map 0:4 -map 0:6",
+        "✔ Process file (drop unwanted subtitles)",
+        id="Defaults keep local and original audio, local subs",
+    ),
+    pytest.param(
+        ["--drop-original"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4 -map 0:6",
+        "✔ Process file (drop original audio, drop unwanted subtitles)",
+        id="Drop original audio (keeps local audio)",
+    ),
+    pytest.param(
+        ["--drop-local-subs"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:3 -map 0:4",
+        "✔ Process file",
+        id="Drop local subs",
+    ),
+)
 
-@pytest.mark.parametrize(
-    ("args", "command_expected", "process_output"),
-    [
-        pytest.param(
-            [],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
-            "✔ Process file",
-            id="Defaults (only keep local audio,no commentary)",
-        ),
-        pytest.param(
-            ["--downmix"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
-            "✔ Process file (downmix to stereo)",
-            id="Don't convert audio to stereo when stereo exists",
-        ),
-        pytest.param(
-            ["--keep-commentary"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4 -map 0:5",
-            "✔ Process file (keep commentary)",
-            id="Keep commentary",
-        ),
-        pytest.param(
-            ["--drop-original"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
-            "✔ Process file (drop original audio)",
-            id="Keep local language from config even when dropped",
-        ),
-        pytest.param(
-            ["--langs", "fr,es"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:3 -map 0:4 -map 0:8",
-            "✔ Process file (drop unwanted subtitles)",
-            id="Keep specified languages",
-        ),
-        pytest.param(
-            ["--keep-subs"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4 -map 0:6 -map 0:7 -map 0:8",
-            "✔ Process file (keep subtitles)",
-            id="Keep all subtitles",
-        ),
-        pytest.param(
-            ["--keep-local-subs"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4 -map 0:6",
-            "✔ Process file (drop unwanted subtitles, keep local subtitles)",
-            id="Keep local subtitles",
-        ),
-    ],
+DOWNMIX_CASES = (
+    pytest.param(
+        [],
+        "-map 0:0 -map 0:1 -map 0:2",
+        "✔ Process file",
+        id="Defaults, drops commentary",
+    ),
+    pytest.param(
+        ["--downmix"],
+        "-map 0:1 -map 0:2 -c copy -map 0:2 -c:a:0 aac -ac:a:0 2 -b:a:0 256k -filter:a:0",
+        "✔ Process file (downmix to stereo)",
+        id="Defaults",
+    ),
 )
-def test_clean_video_process_streams(
-    mocker,
-    mock_ffprobe,
-    mock_video,
-    mock_config,
-    mock_ffmpeg,
-    debug,
-    args,
-    command_expected,
-    process_output,
-):
-    """Test cleaning a video that does not need streams reordered or video converted."""
-    # GIVEN a video in english with correct stream order
-    mocker.patch(
-        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("reference.json")
-    )
-    mocker.patch("vid_cleaner.cli.clean.tmp_to_output", return_value="cleaned_video.mkv")
-    mocker.patch.object(VideoFile, "_find_original_language", return_value=Lang("en"))
 
-    # WHEN the clean command is invoked
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["-vv", "clean", *args, str(mock_video.path)])
+REORDER_CASES = (
+    pytest.param(
+        [],
+        "-i {input} -map 0:2 -map 0:1 -map 0:3 -c copy",
+        "✔ Process file",
+        id="Defaults, reorder streams and process streams in one pass",
+    ),
+)
 
-    output = strip_ansi(result.output)
-    # debug("result", output)
 
-    # THEN the video should be clipped
-    mock_ffmpeg.assert_called_once()  # Check that the ffmpeg command was called once
-    args, _ = mock_ffmpeg.call_args  # Grab the ffmpeg command arguments
-    command = " ".join(args[0])  # Join the arguments into a single string
-    # debug("ffmpeg command", command)
+def _single_pass_cases(probe_fixture, language, reorder_output, cases):
+    """Tag a case table with its ffprobe fixture, detected language and expected reorder log line."""
+    for case in cases:
+        args, command_expected, process_output = case.values
+        yield pytest.param(
+            probe_fixture,
+            language,
+            args,
+            command_expected,
+            (reorder_output, process_output),
+            id=f"{probe_fixture} ({language}): {case.id}",
+        )
+
+
+# Every clean that fuses its work into a single stream-copy ffmpeg pass
+SINGLE_PASS_CASES = (
+    *_single_pass_cases("reference.json", "en", "✔ No streams to reorder", PROCESS_STREAMS_CASES),
+    *_single_pass_cases("reference.json", "fr", "✔ No streams to reorder", FOREIGN_LANGUAGE_CASES),
+    *_single_pass_cases("no_stereo.json", "en", "✔ No streams to reorder", DOWNMIX_CASES),
+    *_single_pass_cases("wrong_order.json", "en", "✔ Reorder streams", REORDER_CASES),
+)
 
-    assert result.exit_code == 0
-    assert command_expected in command
-    assert "✔ No streams to reorder" in output
-    assert process_output in output
-    assert "✅ cleaned_video.mkv" in output
+CONVERT_CASES = (
+    pytest.param(
+        ["--h265"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
+        "-map 0 -c:v libx265 -b:v 0k -minrate 0k -maxrate 0k -bufsize 0k -c:a copy -c:s copy",
+        "✔ Process file",
+        id="Convert to h265",
+    ),
+    pytest.param(
+        ["--vp9"],
+        "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
+        "-map 0 -c:v libvpx-vp9 -b:v 0 -crf 30 -c:a libvorbis -dn -map_chapters -1 -c:s copy",
+        "✔ Process file",
+        id="Convert to vp9",
+    ),
+)
 
 
-@pytest.mark.parametrize(
-    ("args", "command_expected", "process_output"),
-    [
-        pytest.param(
-            [],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:3 -map 0:4 -map 0:6",
-            "✔ Process file (drop unwanted subtitles)",
-            id="Defaults keep local and original audio, local subs",
-        ),
-        pytest.param(
-            ["--drop-original"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4 -map 0:6",
-            "✔ Process file (drop original audio, drop unwanted subtitles)",
-            id="Drop original audio (keeps local audio)",
-        ),
-        pytest.param(
-            ["--drop-local-subs"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:3 -map 0:4",
-            "✔ Process file",
-            id="Drop local subs",
-        ),
-    ],
-)
-def test_clean_video_foreign_language(
-    mocker,
-    mock_ffprobe,
-    mock_video,
-    mock_config,
-    mock_ffmpeg,
-    debug,
-    args,
-    command_expected,
-    process_output,
-):
-    """Test cleaning is in a foreign language."""
-    # GIVEN a video in french with correct stream order
-    mocker.patch(
-        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("reference.json")
-    )
-    mocker.patch("vid_cleaner.cli.clean.tmp_to_output", return_value="cleaned_video.mkv")
-    mocker.patch.object(VideoFile, "_find_original_language", return_value=Lang("fr"))
+def _invoke_clean(mock_video, args):
+    """Invoke the clean command on the mock video and return the result and its plain output."""
+    result = runner.invoke(cli, ["-vv", "clean", *args, str(mock_video.path)])
 
-    # WHEN the clean command is invoked
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["-vv", "clean", *args, str(mock_video.path)])
+    return result, strip_ansi(result.output)
 
-    output = strip_ansi(result.output)
-    # debug("result", output)
 
-    # THEN the video should be clipped
-    mock_ffmpeg.assert_called_once()  # Check that the ffmpeg command was called once
-    args, _ = mock_ffmpeg.call_args  # Grab the ffmpeg command arguments
-    command = " ".join(args[0])  # Join the arguments into a single string
-    # debug("ffmpeg command", command)
+def _assert_single_pass(mock_ffmpeg, result, output, command_expected, expected_output):
+    """Assert that clean ran one ffmpeg pass containing the expected command and log lines."""
+    mock_ffmpeg.assert_called_once()
 
     assert result.exit_code == 0
-    assert command_expected in command
-    assert "✔ No streams to reorder" in output
-    assert process_output in output
+    assert ffmpeg_cmd_contains(mock_ffmpeg.call_args, command_expected)
+    for line in expected_output:
+        assert line in output
     assert "✅ cleaned_video.mkv" in output
 
 
 @pytest.mark.parametrize(
-    ("args", "command_expected", "process_output"),
-    [
-        pytest.param(
-            [],
-            "-map 0:0 -map 0:1 -map 0:2",
-            "✔ Process file",
-            id="Defaults, drops commentary",
-        ),
-        pytest.param(
-            ["--downmix"],
-            "-map 0:1 -map 0:2 -c copy -map 0:2 -c:a:0 aac -ac:a:0 2 -b:a:0 256k -filter:a:0",
-            "✔ Process file (downmix to stereo)",
-            id="Defaults",
-        ),
-    ],
+    ("probe_fixture", "language", "args", "command_expected", "expected_output"),
+    SINGLE_PASS_CASES,
 )
-def test_clean_video_downmix(
-    mocker,
-    mock_ffprobe,
+def test_clean_single_pass(
+    patched_video_file,
     mock_video,
-    mock_config,
     mock_ffmpeg,
-    debug,
+    probe_fixture,
+    language,
     args,
     command_expected,
-    process_output,
+    expected_output,
 ):
-    """Test cleaning a video that does not have a stereo audio stream."""
-    # GIVEN a video in english with correct stream order
-    mocker.patch(
-        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("no_stereo.json")
-    )
-    mocker.patch("vid_cleaner.cli.clean.tmp_to_output", return_value="cleaned_video.mkv")
-    mocker.patch.object(VideoFile, "_find_original_language", return_value=Lang("en"))
+    """Test cleaning videos whose reorder and stream processing fuse into one ffmpeg pass."""
+    # GIVEN a video with the given streams and original language
+    patched_video_file(probe_fixture, language=language)
 
     # WHEN the clean command is invoked
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["-vv", "clean", *args, str(mock_video.path)])
-
-    output = strip_ansi(result.output)
-    # debug("result", output)
-
-    # THEN the video should be clipped
-    mock_ffmpeg.assert_called_once()  # Check that the ffmpeg command was called once
-    args, _ = mock_ffmpeg.call_args  # Grab the ffmpeg command arguments
-    command = " ".join(args[0])  # Join the arguments into a single string
-    # debug("ffmpeg command", command)
-
-    assert result.exit_code == 0
-    assert command_expected in command
-    assert "✔ No streams to reorder" in output
-    assert process_output in output
-    assert "✅ cleaned_video.mkv" in output
+    result, output = _invoke_clean(mock_video, args)
+
+    # THEN ffmpeg should run a single stream-copy pass
+    _assert_single_pass(
+        mock_ffmpeg,
+        result,
+        output,
+        command_expected.format(input=mock_video.path),
+        expected_output,
+    )
 
 
 @pytest.mark.parametrize(
-    ("args", "first_command_expected", "second_command_expected", "process_output"),
-    [
-        pytest.param(
-            [],
-            "-c copy -map 0:2 -map 0:1 -map 0:3 -map 0:0",
-            "-map 0:2 -map 0:1 -map 0:3",
-            "✔ Process file",
-            id="Defaults, reorder streams, then process streams",
-        ),
-    ],
+    ("args", "first_command_expected", "second_command_expected", "process_output"), CONVERT_CASES
 )
-def test_clean_reorganize_streams(
-    mocker,
-    mock_ffprobe,
+def test_convert_video(
+    monkeypatch,
+    patched_video_file,
     mock_video,
-    mock_config,
     mock_ffmpeg,
-    debug,
     args,
     first_command_expected,
     second_command_expected,
     process_output,
 ):
-    """Test cleaning a video that does not have streams in the right order."""
-    # GIVEN a video with the streams out of order
-    mocker.patch(
-        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("wrong_order.json")
-    )
-    mocker.patch("vid_cleaner.cli.clean.tmp_to_output", return_value="cleaned_video.mkv")
-    mocker.patch.object(VideoFile, "_find_original_language", return_value=Lang("en"))
+    """Test converting a video stream to a different format."""
+    # GIVEN a video in english with correct stream order
+    patched_video_file("reference.json")
+    paths = (mock_video.path, mock_video.path)
+    monkeypatch.setattr(VideoFile, "_get_input_and_output", lambda *_, **__: paths)
 
     # WHEN the clean command is invoked
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["-vv", "clean", *args, str(mock_video.path)])
-
-    output = strip_ansi(result.output)
-    # debug("result", output)
+    result, output = _invoke_clean(mock_video, args)
 
-    # THEN the video should be clipped
+    # THEN the video should be processed and then converted
     assert mock_ffmpeg.call_count == 2
-    # debug("ffmpeg calls", mock_ffmpeg.mock_calls)
-
-    first_command = " ".join(mock_ffmpeg.mock_calls[0].args[0])
-    # debug("first command", first_command)
-
-    second_command = " ".join(mock_ffmpeg.mock_calls[2].args[0])
-    # debug("second command", second_command)
+    first_call, second_call = mock_ffmpeg.call_args_list
 
     assert result.exit_code == 0
-    assert first_command_expected in first_command
-    assert second_command_expected in second_command
-    assert "✔ Reorder streams" in output
+    assert ffmpeg_cmd_contains(first_call, first_command_expected)
+    assert ffmpeg_cmd_contains(second_call, second_command_expected)
+    assert "✔ No streams to reorder" in output
     assert process_output in output
     assert "✅ cleaned_video.mkv" in output
 
 
-@pytest.mark.parametrize(
-    ("args", "first_command_expected", "second_command_expected", "process_output"),
-    [
-        pytest.param(
-            ["--h265"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
-            "-map 0 -c:v libx265 -b:v 0k -minrate 0k -maxrate 0k -bufsize 0k -c:a copy -c:s copy",
-            "✔ Process file",
-            id="Convert to h265",
-        ),
-        pytest.param(
-            ["--vp9"],
-            "-map 0:0 -map 0:1 -map 0:2 -map 0:4",
-            "-map 0 -c:v libvpx-vp9 -b:v 0 -crf 30 -c:a libvorbis -dn -map_chapters -1 -c:s copy",
-            "✔ Process file",
-            id="Convert to vp9",
-        ),
-    ],
-)
-def test_convert_video(
-    mocker,
-    mock_ffprobe,
-    mock_video,
-    mock_config,
-    mock_ffmpeg,
-    debug,
-    args,
-    first_command_expected,
-    second_command_expected,
-    process_output,
-):
-    """Test converting a video stream to a different format."""
-    # GIVEN a video in english with correct stream order
-    mocker.patch(
-        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("reference.json")
-    )
-    mocker.patch("vid_cleaner.cli.clean.tmp_to_output", return_value="cleaned_video.mkv")
-    mocker.patch.object(VideoFile, "_find_original_language", return_value=Lang("en"))
-    mocker.patch.object(
-        VideoFile, "_get_input_and_output", return_value=(mock_video.path, mock_video.path)
-    )
-
-    # WHEN the clean command is invoked
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["-vv", "clean", *args, str(mock_video.path)])
+def test_clean_h265_and_vp9(mock_ffmpeg, mock_video):
+    """Test that converting to both H265 and VP9 fails before any file is processed."""
+    # WHEN the clean command is invoked with both --h265 and --vp9
+    result = runner.invoke(cli, ["clean", "--h265", "--vp9", str(mock_video.path)])
 
     output = strip_ansi(result.output)
-    # debug("result", output)
 
-    # THEN the video should be clipped
-    assert mock_ffmpeg.call_count == 2
-    # debug("ffmpeg calls", mock_ffmpeg.mock_calls)
+    # THEN the command should fail without running ffmpeg
+    assert result.exit_code > 0
+    assert "Cannot convert to both H265 and VP9" in output
+    mock_ffmpeg.assert_not_called()
 
-    first_command = " ".join(mock_ffmpeg.mock_calls[0].args[0])
-    # debug("first command", first_command)
 
-    second_command = " ".join(mock_ffmpeg.mock_calls[2].args[0])
-    # debug("second command", second_command)
+def test_clean_nothing_to_process(monkeypatch, patched_video_file, mock_video, mock_ffmpeg):
+    """Test cleaning a video whose streams would all be kept in their current order."""
+    # GIVEN an english video with correctly ordered streams and no stereo track
+    mocks = patched_video_file("no_stereo.json")
+    paths = (mock_video.path, mock_video.path)
+    monkeypatch.setattr(VideoFile, "_get_input_and_output", lambda *_, **__: paths)
 
+    # WHEN the clean command is invoked keeping commentary
+    result, output = _invoke_clean(mock_video, ["--keep-commentary"])
+
+    # THEN ffmpeg should not run and no output file should be written
     assert result.exit_code == 0
-    assert first_command_expected in first_command
-    assert second_command_expected in second_command
+    mock_ffmpeg.assert_not_called()
+    mocks.tmp_to_output.assert_not_called()
     assert "✔ No streams to reorder" in output
-    assert process_output in output
-    assert "✅ cleaned_video.mkv" in output
+    assert "✔ No streams to process" in output
+    assert "✔ No changes needed" in output
+
+
+def test_clean_nothing_to_process_with_out(
+    monkeypatch, tmp_path, patched_video_file, mock_video, mock_ffmpeg
+):
+    """Test that an unchanged video is still written to the requested output file."""
+    # GIVEN an english video with correctly ordered streams and no stereo track
+    mocks = patched_video_file("no_stereo.json")
+    paths = (mock_video.path, mock_video.path)
+    monkeypatch.setattr(VideoFile, "_get_input_and_output", lambda *_, **__: paths)
+    out = tmp_path / "out.mkv"
+
+    # WHEN the clean command is invoked with an output file
+    result, output = _invoke_clean(mock_video, ["--keep-commentary", "--out", str(out)])
+
+    # THEN ffmpeg should not run and the input should be copied to the output file
+    assert result.exit_code == 0
+    mock_ffmpeg.assert_not_called()
+    mocks.tmp_to_output.assert_called_once_with(
+        mock_video.path, stem=mock_video.stem, new_file=out, overwrite=False, copy=True
+    )
+    assert "✔ No changes needed, copy to" in output
@@ -3,16 +3,34 @@
 
 import re
 
-from typer.testing import CliRunner
+import pytest
 
-from tests.pytest_functions import strip_ansi
-from vid_cleaner.vid_cleaner import app
-
-runner = CliRunner()
+from tests.pytest_functions import cli, runner, strip_ansi
 
 
 def test_version():
     """Test printing version and then exiting."""
-    result = runner.invoke(app, ["--version"])
+    result = runner.invoke(cli, ["--version"])
     assert result.exit_code == 0
     assert re.match(r"vid_cleaner: v\d+\.\d+\.\d+", strip_ansi(result.output))
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["clean", "--help"],
+        ["clip", "--help"],
+        ["inspect", "--help"],
+    ],
+)
+def test_help_skips_config(mocker, args):
+    """Test that command help does not create or validate the configuration file."""
+    # GIVEN a patched configuration validator
+    mock_validate = mocker.patch("vid_cleaner.vid_cleaner.validate_config")
+
+    # WHEN a command's help is printed
+    result = runner.invoke(cli, args)
+
+    # THEN the configuration should not be touched
+    assert result.exit_code == 0
+    mock_validate.assert_not_called()
@@ -4,97 +4,152 @@
 import re
 
 import pytest
-from typer.testing import CliRunner
+import typer
 
-from tests.pytest_functions import strip_ansi
-from vid_cleaner.config import VidCleanerConfig
-from vid_cleaner.vid_cleaner import app
+from tests.pytest_functions import cli, ffmpeg_cmd_contains, runner, strip_ansi
+from vid_cleaner.cli.clip import _clip_file, _validate_timestamp, clip
+from vid_cleaner.models import VideoFile
 
-runner = CliRunner()
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_probe(module_mocker, mock_ffprobe):
+    """Patch ffprobe and the output move once for every test in this module."""
+    module_mocker.patch(
+        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("reference.json")
+    )
+    module_mocker.patch("vid_cleaner.cli.clip.tmp_to_output", return_value="clipped_video.mkv")
 
 
 @pytest.mark.parametrize(
-    ("args", "expected"),
+    ("value", "name"),
     [
-        (["--start", "0:0"], "Start must be in format HH:MM:SS "),
-        (["--duration", "0:0"], "Duration must be in format HH:MM:SS "),
+        ("0:0", "Start"),
+        ("0:0", "Duration"),
+        ("00:60:00", "Start"),
+        ("00:00:99", "Duration"),
     ],
 )
-def test_clip_option_errors(mock_config, debug, mock_video, args, expected):
-    """Test the clip command with invalid time options."""
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["clip", *args, str(mock_video.path)])
+def test_validate_timestamp_errors(value, name):
+    """Test rejecting clip timestamps that are not HH:MM:SS."""
+    # WHEN an invalid timestamp is validated
+    # THEN a BadParameter error names the option
+    with pytest.raises(typer.BadParameter, match=f"{name} must be in format HH:MM:SS"):
+        _validate_timestamp(value, name)
+
+
+def test_clip_option_errors(mock_video):
+    """Test the clip command with an invalid time option."""
+    # WHEN the clip command is invoked with an invalid start time
+    result = runner.invoke(cli, ["clip", "--start", "0:0", str(mock_video.path)])
 
     output = strip_ansi(result.output)
-    # debug("result", output)
 
+    # THEN the command should fail with a usage error
     assert result.exit_code > 0
-    assert expected in output
+    assert "Start must be in format HH:MM:SS " in output
 
 
-@pytest.mark.parametrize(
-    ("args", "expected"),
-    [
-        ([], "-ss 00:00:00 -t 00:01:00 -map 0"),
-        (["--start", "00:05:00"], "-ss 00:05:00 -t 00:01:00 -map 0"),
-        (["--start", "00:05:00", "--duration", "00:10:00"], "-ss 00:05:00 -t 00:10:00 -map 0"),
-        (["--duration", "00:10:00"], "-ss 00:00:00 -t 00:10:00 -map 0"),
-    ],
+# Clip options and the -ss/-t arguments they should produce
+CLIP_CASES = (
+    ([], "-ss 00:00:00 -t 00:01:00"),
+    (["--start", "00:05:00"], "-ss 00:05:00 -t 00:01:00"),
+    (["--start", "00:05:00", "--duration", "00:10:00"], "-ss 00:05:00 -t 00:10:00"),
+    (["--duration", "00:10:00"], "-ss 00:00:00 -t 00:10:00"),
 )
-def test_clipping_video(
-    mocker, mock_ffprobe, mock_video, mock_config, mock_ffmpeg, debug, args, expected
-):
-    """Test clipping a video."""
-    # Setup mocks
-    mocker.patch(
-        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("reference.json")
-    )
-    mocker.patch("vid_cleaner.cli.clip.tmp_to_output", return_value="clipped_video.mkv")
+# The ffmpeg arguments each clip case should run with
+CLIP_COMMANDS = tuple(f"{expected} -map 0" for _, expected in CLIP_CASES)
 
-    # WHEN the clip command is invoked
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["clip", *args, str(mock_video.path)])
 
-    output = strip_ansi(result.output)
-    # debug("result", output)
+def test_clipping_video(mock_video, mock_ffmpeg):
+    """Test clipping a video."""
+    for args, _ in CLIP_CASES:
+        # WHEN the clip command is invoked
+        result = runner.invoke(cli, ["clip", *args, str(mock_video.path)])
 
-    # THEN the video should be clipped
-    mock_ffmpeg.assert_called_once()  # Check that the ffmpeg command was called once
-    args, _ = mock_ffmpeg.call_args  # Grab the ffmpeg command arguments
-    command = " ".join(args[0])  # Join the arguments into a single string
+        # THEN the clipped video should be written
+        assert result.exit_code == 0, args
+        assert "✅ clipped_video.mkv" in strip_ansi(result.output)
 
-    assert result.exit_code == 0
-    assert expected in command
-    assert "✅ clipped_video.mkv" in output
+    # AND ffmpeg should run once per invocation with the expected arguments
+    assert mock_ffmpeg.call_count == len(CLIP_CASES)
+    for call, expected in zip(mock_ffmpeg.call_args_list, CLIP_COMMANDS, strict=True):
+        assert ffmpeg_cmd_contains(call, expected), expected
 
 
 @pytest.mark.parametrize(
-    ("args", "expected"),
+    ("start", "duration"),
     [
-        ([], "-ss 00:00:00 -t 00:01:00"),
-        (["--start", "00:05:00"], "-ss 00:05:00 -t 00:01:00"),
-        (["--start", "00:05:00", "--duration", "00:10:00"], "-ss 00:05:00 -t 00:10:00"),
-        (["--duration", "00:10:00"], "-ss 00:00:00 -t 00:10:00"),
+        ("00:00:00", "00:01:00"),
+        ("00:05:00", "00:10:00"),
     ],
 )
-def test_clipping_video_dryrun(
-    mocker, mock_ffprobe, mock_video, mock_config, mock_ffmpeg, debug, args, expected
-):
-    """Test clipping a video."""
-    # Setup mocks
-    mocker.patch(
-        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("reference.json")
-    )
-    mocker.patch("vid_cleaner.cli.clip.tmp_to_output", return_value="clipped_video.mkv")
-
-    # WHEN the clip command is invoked
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["clip", "-n", *args, str(mock_video.path)])
-
+def test_clip_command(mock_video, mock_ffmpeg, start, duration):
+    """Test the ffmpeg command for a clip seeks and limits the output and copies every stream."""
+    # GIVEN a fresh VideoFile
+    video = VideoFile(mock_video.path)
+
+    # WHEN the video is clipped
+    video.clip(start, duration)
+    video.cleanup()
+
+    # THEN ffmpeg should run once
+    mock_ffmpeg.assert_called_once()
+    cmd = mock_ffmpeg.call_args.args[0]
+
+    # AND the start and duration should be passed through unchanged after the input
+    input_index = cmd.index("-i")
+    assert cmd.index("-ss") > input_index
+    assert cmd[cmd.index("-ss") + 1] == start
+    assert cmd.index("-t") > input_index
+    assert cmd[cmd.index("-t") + 1] == duration
+
+    # AND every stream should be copied without re-encoding
+    assert ffmpeg_cmd_contains(mock_ffmpeg.call_args, "-map 0 -c copy")
+
+
+def test_clipping_video_dryrun(mock_video, mock_ffmpeg):
+    """Test clipping a video in dry run mode."""
+    # WHEN the clip command is invoked with --dry-run
+    result = runner.invoke(cli, ["clip", "-n", str(mock_video.path)])
     output = strip_ansi(result.output)
 
     # THEN the video should not be clipped
-    mock_ffmpeg.assert_not_called()  # Check that the ffmpeg command was called once
+    mock_ffmpeg.assert_not_called()
+
     assert result.exit_code == 0
-    assert expected in output
+    assert "-ss 00:00:00 -t 00:01:00" in output
     assert "✅ clipped_video.mkv" not in output
+
+
+def test_clip_file_removes_tmp_dir(mock_video, mock_ffmpeg):
+    """Test that clipping a file removes its temporary directory."""
+    # GIVEN a fresh VideoFile, as a pool worker would receive it
+    video = VideoFile(mock_video.path)
+
+    # WHEN the file is clipped in dry run mode, which creates the temporary directory
+    _clip_file(video, "00:00:00", "00:01:00", out=None, overwrite=False, dry_run=True)
+
+    # THEN the temporary directory should already be removed
+    mock_ffmpeg.assert_not_called()
+    assert not video.tmp_dir.exists()
+
+
+def test_clip_removes_tmp_dir_when_worker_fails(mocker, mock_video):
+    """Test that the parent process removes temporary directories left behind by a failed worker."""
+    # GIVEN a worker that dies after creating its temporary directory
+    video = VideoFile(mock_video.path)
+
+    def _failing_worker(func, files, jobs):
+        video.tmp_dir.mkdir(parents=True)
+        (video.tmp_dir / "1_clip.mkv").touch()
+        raise RuntimeError
+        yield
+
+    mocker.patch("vid_cleaner.cli.clip.process_files", side_effect=_failing_worker)
+
+    # WHEN the file is clipped
+    with pytest.raises(RuntimeError):
+        clip([video], "00:00:00", "00:01:00", out=None, overwrite=False, dry_run=False)
+
+    # THEN the temporary directory should be removed
+    assert not video.tmp_dir.exists()
@@ -1,15 +1,45 @@
 # type: ignore
 """Test helpers."""
 
+import contextlib
 import io
+import os
+import subprocess
+from functools import partial
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 import typer
 
-from vid_cleaner.utils import console, copy_with_callback, errors, existing_file_path, tmp_to_output
-from vid_cleaner.utils.helpers import _copyfileobj
+from vid_cleaner.utils import (
+    console,
+    copy_with_callback,
+    errors,
+    existing_file_path,
+    ffprobe,
+    process_files,
+    tmp_to_output,
+)
+from vid_cleaner.utils.helpers import _copyfileobj, _ffprobe_cached, _init_worker
+
+
+def _mkfile(path):
+    """Create an empty file that must not exist yet, in a single open call instead of touch's utime and open."""
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+
+
+class _Counter:
+    """Lightweight progress callback that counts calls and keeps the last value."""
+
+    __slots__ = ("last", "n")
+
+    def __init__(self):
+        self.n = 0
+        self.last = None
+
+    def __call__(self, copied):
+        self.n += 1
+        self.last = copied
 
 
 def test_copy_with_callback_success(tmp_path):
@@ -18,7 +48,7 @@ def test_copy_with_callback_success(tmp_path):
     src = tmp_path / "source.txt"
     dest = tmp_path / "destination.txt"
     src.write_text("Sample data")
-    callback = MagicMock()
+    callback = _Counter()
 
     # WHEN copy_with_callback is called
     result = copy_with_callback(src, dest, callback)
@@ -27,7 +57,22 @@ def test_copy_with_callback_success(tmp_path):
     assert dest.read_text() == "Sample data"
     assert result == dest
     # AND the callback should have been called at least once
-    assert callback.called
+    assert callback.n > 0
+
+
+def test_copy_with_callback_copy_file_range_copies_nothing(mocker, tmp_path):
+    """Test copy_with_callback falls back to a userspace copy when copy_file_range copies nothing."""
+    # GIVEN a filesystem where copy_file_range reports 0 bytes copied instead of raising
+    mocker.patch("vid_cleaner.utils.helpers.os.copy_file_range", return_value=0, create=True)
+    src = tmp_path / "source.txt"
+    dest = tmp_path / "destination.txt"
+    src.write_text("Sample data")
+
+    # WHEN copy_with_callback is called
+    copy_with_callback(src, dest)
+
+    # THEN the data should still be copied
+    assert dest.read_text() == "Sample data"
 
 
 def test_copy_with_callback_file_not_found():
@@ -46,7 +91,7 @@ def test_copy_with_callback_same_file(tmp_path):
     """Test copy_with_callback helper."""
     # GIVEN same source and destination file
     src = tmp_path / "source.txt"
-    src.touch()  # Create an empty file
+    _mkfile(src)  # Create an empty file
 
     # WHEN copy_with_callback is called with the same file as source and dest
     # THEN it should raise SameFileError
@@ -59,7 +104,7 @@ def test_copy_with_callback_invalid_callback(tmp_path):
     # GIVEN valid source and destination, but invalid callback
     src = tmp_path / "source.txt"
     dest = tmp_path / "destination.txt"
-    src.touch()
+    _mkfile(src)
     invalid_callback = "not a callable"
 
     # WHEN copy_with_callback is called with an invalid callback
@@ -68,30 +113,33 @@ def test_copy_with_callback_invalid_callback(tmp_path):
         copy_with_callback(src, dest, invalid_callback)
 
 
-def test_copyfileobj():
+@pytest.mark.parametrize("size", [0, 19, 20, 21, 40, 200])
+def test_copyfileobj(size):
     """Test _copyfileobj helper."""
-    src_data = b"Hello World" * 100  # Sample data
-    src = io.BytesIO(src_data)  # Source buffer
-    dest = io.BytesIO()  # Destination buffer
-    callback = MagicMock()  # Mock callback
-    length = 20  # Length of data to copy at once
-
-    # Call _copyfileobj
+    # GIVEN a source buffer around and across chunk boundaries
+    length = 20
+    src_data = b"\1" * size
+    src = io.BytesIO(src_data)
+    # Pre-size the destination so writes overwrite in place instead of growing the buffer
+    dest = io.BytesIO(bytes(size))
+    callback = _Counter()
+
+    # WHEN _copyfileobj is called
     _copyfileobj(src, dest, callback, length)
 
-    # Check if all data was copied correctly
+    # THEN all data should be copied
     assert dest.getvalue() == src_data
-
-    # Check if callback was called the correct number of times
-    expected_calls = len(src_data) // length
-    assert callback.call_count == expected_calls
+    # AND the callback should be called once per chunk, including a partial last chunk
+    assert callback.n == -(-size // length)
+    # AND the last callback should report the total bytes copied
+    assert callback.last == (size or None)
 
 
 def test_tmp_to_output_1(tmp_path):
     """Test tmp_to_output helper."""
     # GIVEN a temporary file
     tmp_file = tmp_path / "test.txt"
-    tmp_file.touch()
+    _mkfile(tmp_file)
 
     # WHEN tmp_to_output is called
     result = tmp_to_output(tmp_file, "test_filename")
@@ -99,25 +147,34 @@ def test_tmp_to_output_1(tmp_path):
     # THEN it should return the file path
     assert isinstance(result, Path)
     assert result == tmp_path / "test_filename.txt"
-    assert result.exists()
     assert result.is_file()
+    # AND the temporary file should have been moved
+    assert not tmp_file.exists()
 
     # WHEN tmp_to_output is called again
+    _mkfile(tmp_file)
     result = tmp_to_output(tmp_file, "test_filename")
 
     # THEN it should return the file path with a suffix
     assert isinstance(result, Path)
     assert result == tmp_path / "test_filename_1.txt"
-    assert result.exists()
+    assert result.is_file()
+
+    # WHEN tmp_to_output is called a third time
+    _mkfile(tmp_file)
+    result = tmp_to_output(tmp_file, "test_filename")
+
+    # THEN it should return the next free file path
+    assert result == tmp_path / "test_filename_2.txt"
     assert result.is_file()
 
     # WHEN overwrite is set to True
+    _mkfile(tmp_file)
     result = tmp_to_output(tmp_file, "test_filename", overwrite=True)
 
     # THEN it should return the file path
     assert isinstance(result, Path)
     assert result == tmp_path / "test_filename.txt"
-    assert result.exists()
     assert result.is_file()
 
 
@@ -125,7 +182,7 @@ def test_tmp_to_output_2(tmp_path):
     """Test tmp_to_output helper."""
     # GIVEN a temporary file
     tmp_file = tmp_path / "test.txt"
-    tmp_file.touch()
+    _mkfile(tmp_file)
 
     # WHEN tmp_to_output is called with a new_file argument
     result = tmp_to_output(tmp_file, "test_filename", new_file=tmp_path / "test" / "new_file.txt")
@@ -133,15 +190,76 @@ def test_tmp_to_output_2(tmp_path):
     # THEN it should return the file path
     assert isinstance(result, Path)
     assert result == tmp_path / "test" / "new_file.txt"
-    assert result.exists()
     assert result.is_file()
 
 
+def test_tmp_to_output_copy(tmp_path):
+    """Test tmp_to_output helper keeps the source file when copying."""
+    # GIVEN a file
+    src_file = tmp_path / "test.txt"
+    _mkfile(src_file)
+
+    # WHEN tmp_to_output is called with copy=True
+    result = tmp_to_output(src_file, "test_filename", new_file=tmp_path / "new_file.txt", copy=True)
+
+    # THEN the output file should be written
+    assert result == tmp_path / "new_file.txt"
+    assert result.read_bytes() == src_file.read_bytes()
+    # AND the source file should have been kept
+    assert src_file.is_file()
+
+
+def test_tmp_to_output_name_taken_after_scan(mocker, tmp_path):
+    """Test tmp_to_output never reuses a name created by another process after the directory scan."""
+    # GIVEN an output name which another worker creates after this one lists the directory
+    tmp_file = tmp_path / "tmp" / "test.txt"
+    tmp_file.parent.mkdir()
+    tmp_file.write_text("new")
+
+    scandir = os.scandir
+
+    def _scan_then_other_worker_writes(path):
+        entries = list(scandir(path))
+        (tmp_path / "test_filename.txt").write_text("other")
+        return contextlib.nullcontext(entries)
+
+    mocker.patch("vid_cleaner.utils.helpers.os.scandir", side_effect=_scan_then_other_worker_writes)
+
+    # WHEN tmp_to_output is called
+    result = tmp_to_output(tmp_file, "test_filename", new_file=tmp_path / "test_filename.txt")
+
+    # THEN the next free name should be used and the other output kept
+    assert result == tmp_path / "test_filename_1.txt"
+    assert result.read_text() == "new"
+    assert (tmp_path / "test_filename.txt").read_text() == "other"
+
+
+def test_tmp_to_output_parallel_same_stem(monkeypatch, tmp_path):
+    """Test parallel workers moving files with the same stem write separate outputs."""
+    # GIVEN two temporary files with the same stem and an output directory
+    tmp_files = []
+    for name in ("a", "b"):
+        tmp_file = tmp_path / name / "video.mkv"
+        tmp_file.parent.mkdir()
+        tmp_file.write_text(name)
+        tmp_files.append(tmp_file)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    monkeypatch.chdir(out_dir)
+
+    # WHEN both are moved to the current directory in parallel
+    result = list(process_files(partial(tmp_to_output, stem="video"), tmp_files, jobs=2))
+
+    # THEN each file should get its own output name
+    assert sorted(result) == [out_dir / "video.mkv", out_dir / "video_1.mkv"]
+    assert sorted(path.read_text() for path in result) == ["a", "b"]
+
+
 def test_existing_file_path_1(tmp_path):
     """Test existing_file_path helper."""
     # GIVEN a file that exists
     file = tmp_path / "test.txt"
-    file.touch()
+    _mkfile(file)
 
     # WHEN existing_file_path is called
     # THEN it should return the file path
@@ -159,6 +277,18 @@ def test_existing_file_path_2(tmp_path):
         existing_file_path(file)
 
 
+def test_existing_file_path_below_file(tmp_path):
+    """Test existing_file_path helper."""
+    # GIVEN a path below a regular file
+    file = tmp_path / "test.mkv"
+    _mkfile(file)
+
+    # WHEN existing_file_path is called
+    # THEN raise typer.BadParameter
+    with pytest.raises(typer.BadParameter):
+        existing_file_path(file / "x")
+
+
 def test_existing_file_path_3(tmp_path):
     """Test existing_file_path helper."""
     # GIVEN a directory that exists
@@ -169,3 +299,105 @@ def test_existing_file_path_3(tmp_path):
     # THEN raise typer.BadParameter
     with pytest.raises(typer.BadParameter):
         existing_file_path(directory)
+
+
+def test_ffprobe_cache(mocker, tmp_path):
+    """Test ffprobe caches results until the file changes."""
+    # GIVEN a video file and a mocked ffprobe
+    _ffprobe_cached.cache_clear()
+    mock_probe = mocker.patch(
+        "vid_cleaner.utils.helpers.subprocess.run",
+        return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout='{"streams": []}'),
+    )
+    file = tmp_path / "test.mkv"
+    file.write_text("video")
+
+    # WHEN ffprobe is called twice for the same file
+    first = ffprobe(file)
+    second = ffprobe(file)
+
+    # THEN ffprobe should only run once
+    assert first == second == {"streams": []}
+    assert mock_probe.call_count == 1
+
+    # WHEN a caller changes its result
+    first["streams"].append({"index": 0})
+
+    # THEN later lookups should not see the change
+    assert ffprobe(file) == {"streams": []}
+    assert mock_probe.call_count == 1
+
+    # WHEN the file changes
+    file.write_text("new video")
+    ffprobe(file)
+
+    # THEN ffprobe should run again
+    assert mock_probe.call_count == 2
+    _ffprobe_cached.cache_clear()
+
+
+def test_ffprobe_error(mocker, tmp_path):
+    """Test ffprobe reports errors from stderr and exits."""
+    # GIVEN a file ffprobe cannot read
+    _ffprobe_cached.cache_clear()
+    mock_probe = mocker.patch(
+        "vid_cleaner.utils.helpers.subprocess.run",
+        side_effect=subprocess.CalledProcessError(1, "ffprobe", stderr="Invalid data found\n"),
+    )
+    file = tmp_path / "broken.mkv"
+    file.write_text("not a video")
+
+    # WHEN ffprobe is called
+    # THEN it should exit with an error
+    with pytest.raises(typer.Exit):
+        ffprobe(file)
+
+    # AND ffprobe should be asked to write errors to stderr
+    assert mock_probe.call_args.args[0][1:3] == ["-v", "error"]
+    _ffprobe_cached.cache_clear()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_process_files(jobs):
+    """Test process_files helper."""
+    # GIVEN a list of items
+    items = ["a", "b", "c"]
+
+    # WHEN process_files is called serially or in parallel
+    result = list(process_files(str.upper, items, jobs=jobs))
+
+    # THEN the results should be returned in the order of the items
+    assert result == ["A", "B", "C"]
+
+
+def test_process_files_configures_worker_logging(mocker):
+    """Test process_files configures logging in each worker with the parent's settings."""
+    # GIVEN configured logging and a mocked process pool
+    settings = {"verbosity": 1, "log_file": None, "log_to_file": False}
+    mocker.patch("vid_cleaner.utils.helpers.logger_settings", return_value=settings)
+    executor = mocker.patch("vid_cleaner.utils.helpers.ProcessPoolExecutor")
+    executor.return_value.__enter__.return_value.map.return_value = iter([("A", ""), ("B", "")])
+
+    # WHEN process_files runs in parallel
+    result = list(process_files(str.upper, ["a", "b"], jobs=2))
+
+    # THEN each worker should be initialized with the parent's logging settings
+    assert result == ["A", "B"]
+    assert executor.call_args.kwargs["initializer"] is _init_worker
+    assert executor.call_args.kwargs["initargs"] == (settings,)
+
+
+def _print_item(item):
+    """Print an item to the console from a pool worker."""
+    console.print(f"item {item}")
+    return item
+
+
+def test_process_files_prints_worker_output_in_order(capsys):
+    """Test process_files prints each worker's console output as one block, in item order."""
+    # WHEN items that print to the console are processed in parallel
+    result = list(process_files(_print_item, ["a", "b", "c"], jobs=2))
+
+    # THEN the output of each item should be printed by the parent in order
+    assert result == ["a", "b", "c"]
+    assert capsys.readouterr().out == "item a\nitem b\nitem c\n"
@@ -3,44 +3,45 @@
 
 import re
 
-from typer.testing import CliRunner
+import pytest
 
-from tests.pytest_functions import strip_ansi
-from vid_cleaner.config import VidCleanerConfig
-from vid_cleaner.vid_cleaner import app
+from tests.pytest_functions import cli, runner, strip_ansi
+from vid_cleaner.constants import FFPROBE_TABLE_ENTRIES
 
-runner = CliRunner()
+# Rows expected in the inspect table for reference.json
+INSPECT_TABLE_PATTERNS = (
+    re.compile(r"0 │ video\s+│ h264"),
+    re.compile(r"9 │ video\s+│ mjpeg"),
+    re.compile(r"eng\s+│ 8\s+│ 7\.1"),
+    re.compile(r"1920\s+│ 1080\s+│ Test"),
+)
 
 
-def test_inspect_table(mock_config, debug, mock_video, mock_ffprobe, mocker):
-    """Test printing a table of video information."""
-    # Setup mocks
-    mocker.patch(
+@pytest.fixture(scope="module")
+def mock_probe(module_mocker, mock_ffprobe):
+    """Patch ffprobe once for every test in this module so the real probe parsing still runs."""
+    return module_mocker.patch(
         "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("reference.json")
     )
 
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["inspect", str(mock_video.path)])
+
+def test_inspect_table(mock_probe, mock_video):
+    """Test printing a table of video information."""
+    result = runner.invoke(cli, ["inspect", str(mock_video.path)])
 
     output = strip_ansi(result.output)
     # debug("result", output)
 
     assert result.exit_code == 0
-    assert re.search(r"0 │ video +│ h264", output)
-    assert re.search(r"9 │ video +│ mjpeg", output)
-    assert re.search(r"eng +│ 8 +│ 7.1", output)
-    assert re.search(r"1920 +│ 1080 +│ Test", output)
+    mock_probe.assert_any_call(mock_video.path, fields=FFPROBE_TABLE_ENTRIES)
+    assert "Test Move" in output
+    for pattern in INSPECT_TABLE_PATTERNS:
+        assert pattern.search(output), pattern.pattern
 
 
-def test_inspect_json(mock_config, debug, mock_video, mock_ffprobe, mocker):
+def test_inspect_json(mock_probe, mock_video):
     """Test printing json output of video information."""
-    # Setup mocks
-    mocker.patch(
-        "vid_cleaner.models.video_file.ffprobe", return_value=mock_ffprobe("reference.json")
-    )
-
-    with VidCleanerConfig.change_config_sources(mock_config()):
-        result = runner.invoke(app, ["inspect", "--json", str(mock_video.path)])
+    result = runner.invoke(cli, ["inspect", "--json", str(mock_video.path)])
 
     output = strip_ansi(result.output)
     # debug("result", output)